@@ -0,0 +1,278 @@
+"""Synthetic multi-board load benchmark for the FireBoard BLE hub.
+
+Runs N simulated FireBoards with M probes each through the real
+FireboardHub and sensor entities inside a bare Home Assistant core
+instance. No Bluetooth hardware is needed: every board is served by a
+ReplayTransport fed with generated frames.
+
+    python benchmarks/bench_hub.py --boards 8 --channels 6 --rate 1 --duration 30
+    python benchmarks/bench_hub.py --json bench_output.txt --baseline old.json
+
+Reports per-packet CPU time (in the notification handler and for the
+whole process), event-loop lag, state writes per second and memory per
+hub. Exits non-zero if a board's Signal Strength or Connected Via sensor
+was never written. With --baseline, also when a figure regresses by more
+than --tolerance.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import device_registry as dr, entity, entity_registry as er
+from homeassistant.helpers.entity_component import EntityComponent
+
+from custom_components.fireboard_ble import sensor as fb_sensor
+from custom_components.fireboard_ble.capture import (
+    KIND_ADVERTISEMENT,
+    KIND_NOTIFICATION,
+    CaptureRecord,
+    _pack_advertisement,
+)
+from custom_components.fireboard_ble.replay import ReplayTransport
+
+_LOGGER = logging.getLogger("fireboard_bench")
+
+LAG_INTERVAL = 0.05
+# Figures compared against --baseline (lower is better for all of them)
+REGRESSION_KEYS = ("handler_us_per_packet", "cpu_us_per_packet", "loop_lag_p99_ms", "state_writes_per_second")
+
+
+def synth_records(channels, rate, duration, mtu, proxies, seed):
+    """Frames for one board: `rate` notifications/s per channel plus adverts."""
+    rng = random.Random(seed)
+    temps = {ch: rng.uniform(80, 250) for ch in range(1, channels + 1)}
+    records = []
+    period = 1 / rate
+    ticks = int(duration * rate)
+
+    for tick in range(ticks):
+        base = tick * period
+        for ch in temps:
+            temps[ch] += rng.uniform(-0.4, 0.5)
+            frame = json.dumps(
+                {"channel": ch, "temp": round(temps[ch], 1), "date": f"2024-01-01 00:{tick % 60:02d}", "degreetype": 2},
+                separators=(",", ":"),
+            ).encode()
+            ts = base + ch * period / (channels + 1)
+            if mtu:
+                for start in range(0, len(frame), mtu):
+                    records.append(CaptureRecord(ts, KIND_NOTIFICATION, frame[start:start + mtu]))
+            else:
+                records.append(CaptureRecord(ts, KIND_NOTIFICATION, frame))
+
+    for second in range(int(duration)):
+        for proxy in range(proxies):
+            advert = SimpleNamespace(
+                rssi=-60 - proxy * 5 - rng.randint(0, 6),
+                source=f"proxy-{proxy}",
+                name="FIREBOARD",
+                service_data={},
+                manufacturer_data={},
+            )
+            records.append(CaptureRecord(second + proxy * 0.1, KIND_ADVERTISEMENT, _pack_advertisement(advert)))
+
+    records.sort(key=lambda record: record.timestamp)
+    return records
+
+
+async def make_hass(config_dir):
+    hass = HomeAssistant(config_dir)
+    entity.async_setup(hass)
+    await er.async_load(hass)
+    await dr.async_load(hass)
+    await hass.async_start()
+    return hass
+
+
+def make_records(args):
+    return [
+        synth_records(args.channels, args.rate, args.duration, args.mtu, args.proxies, index)
+        for index in range(args.boards)
+    ]
+
+
+def make_hubs(hass, component, args, speed, board_records):
+    hubs = []
+    for index, records in enumerate(board_records):
+        mac = "F0:0D:00:00:{:02X}:{:02X}".format(index // 256, index % 256)
+        entry = SimpleNamespace(entry_id=f"bench{index}", options={}, data={})
+        transport = ReplayTransport(hass, speed=speed, records=records)
+
+        def add_entities(entities):
+            hass.async_create_task(component.async_add_entities(entities))
+
+        hub = fb_sensor.FireboardHub(
+            hass, entry, mac, f"Bench-{index}", False, f"bench/{index}", add_entities, transport=transport
+        )
+        add_entities([
+            fb_sensor.FireboardRSSISensor(hub),
+            fb_sensor.FireboardStatusSensor(hub),
+            fb_sensor.FireboardSourceSensor(hub),
+        ])
+        hubs.append((hub, transport))
+    return hubs
+
+
+def instrument(hub, totals):
+    """Time the notification handler itself."""
+    handler = hub._handle_notification
+
+    def timed(sender, data):
+        started = time.perf_counter_ns()
+        handler(sender, data)
+        totals["handler_ns"] += time.perf_counter_ns() - started
+        totals["packets"] += 1
+
+    hub._handle_notification = timed
+
+
+async def measure_lag(samples, stop):
+    loop = asyncio.get_running_loop()
+    while not stop.is_set():
+        expected = loop.time() + LAG_INTERVAL
+        await asyncio.sleep(LAG_INTERVAL)
+        samples.append(max(0.0, loop.time() - expected))
+
+
+async def timing_phase(args):
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = await make_hass(config_dir)
+        component = EntityComponent(_LOGGER, "sensor", hass)
+        hubs = make_hubs(hass, component, args, args.speed, make_records(args))
+        await hass.async_block_till_done()
+
+        totals = {"handler_ns": 0, "packets": 0}
+        for hub, _ in hubs:
+            instrument(hub, totals)
+
+        writes = {"count": 0}
+
+        def on_state_changed(event):
+            if event.data["entity_id"].startswith("sensor."):
+                writes["count"] += 1
+
+        hass.bus.async_listen(EVENT_STATE_CHANGED, on_state_changed)
+
+        lag, stop = [], asyncio.Event()
+        lag_task = asyncio.create_task(measure_lag(lag, stop))
+        cpu_started = time.process_time()
+        wall_started = time.perf_counter()
+
+        await asyncio.gather(*(transport.play(hub) for hub, transport in hubs))
+
+        wall = time.perf_counter() - wall_started
+        cpu = time.process_time() - cpu_started
+        stop.set()
+        await lag_task
+        await hass.async_block_till_done()
+        # The replayed adverts must reach the diagnostic sensors
+        diagnostics_updated = sum(
+            1 for hub, _ in hubs
+            if hub.rssi_sensor.native_value is not None and hub.source_sensor.native_value != "Unknown"
+        )
+        await hass.async_stop(force=True)
+
+    lag.sort()
+    packets = max(totals["packets"], 1)
+    return {
+        "packets": totals["packets"],
+        "wall_seconds": round(wall, 2),
+        "handler_us_per_packet": round(totals["handler_ns"] / packets / 1000, 2),
+        "cpu_us_per_packet": round(cpu / packets * 1e6, 2),
+        "loop_lag_mean_ms": round(sum(lag) / len(lag) * 1000, 3) if lag else 0.0,
+        "loop_lag_p99_ms": round(lag[int(len(lag) * 0.99) - 1] * 1000, 3) if lag else 0.0,
+        "loop_lag_max_ms": round(lag[-1] * 1000, 3) if lag else 0.0,
+        "state_writes": writes["count"],
+        "state_writes_per_second": round(writes["count"] / wall, 2),
+        "diagnostics_updated": diagnostics_updated,
+    }
+
+
+async def memory_phase(args):
+    """Replay the same load at full speed under tracemalloc."""
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = await make_hass(config_dir)
+        component = EntityComponent(_LOGGER, "sensor", hass)
+        board_records = make_records(args)
+        tracemalloc.start()
+        baseline = tracemalloc.take_snapshot()
+        hubs = make_hubs(hass, component, args, 0, board_records)
+        await asyncio.gather(*(transport.play(hub) for hub, transport in hubs))
+        await hass.async_block_till_done()
+        snapshot = tracemalloc.take_snapshot()
+        tracemalloc.stop()
+        grown = sum(stat.size_diff for stat in snapshot.compare_to(baseline, "filename"))
+        await hass.async_stop(force=True)
+    return {"memory_kib_per_hub": round(grown / 1024 / args.boards, 1)}
+
+
+def check_regressions(result, baseline_path, tolerance):
+    with open(baseline_path, encoding="utf-8") as baseline_file:
+        baseline = json.load(baseline_file)
+    failures = []
+    for key in REGRESSION_KEYS + ("memory_kib_per_hub",):
+        old, new = baseline.get(key), result.get(key)
+        if old and new is not None and new > old * (1 + tolerance):
+            failures.append(f"{key}: {old} -> {new}")
+    return failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--boards", type=int, default=4)
+    parser.add_argument("--channels", type=int, default=6)
+    parser.add_argument("--rate", type=float, default=1.0, help="notifications per second per channel")
+    parser.add_argument("--duration", type=float, default=20.0, help="simulated seconds per board")
+    parser.add_argument("--speed", type=float, default=1.0, help="replay speed (0 = as fast as possible)")
+    parser.add_argument("--mtu", type=int, default=0, help="split frames into notifications of this size")
+    parser.add_argument("--proxies", type=int, default=2, help="proxies advertising each board")
+    parser.add_argument("--skip-memory", action="store_true")
+    parser.add_argument("--json", help="write the results to this file")
+    parser.add_argument("--baseline", help="compare against a previous --json result")
+    parser.add_argument("--tolerance", type=float, default=0.2)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.ERROR)
+
+    result = {"boards": args.boards, "channels": args.channels, "rate": args.rate, "mtu": args.mtu}
+    result.update(asyncio.run(timing_phase(args)))
+    if not args.skip_memory:
+        result.update(asyncio.run(memory_phase(args)))
+
+    for key, value in result.items():
+        print(f"{key:>26}: {value}")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as out:
+            json.dump(result, out, indent=2)
+
+    status = 0
+    if result["diagnostics_updated"] < args.boards:
+        print(f"FAILED Signal Strength / Connected Via updated on {result['diagnostics_updated']} of {args.boards} boards")
+        status = 1
+
+    if args.baseline:
+        failures = check_regressions(result, args.baseline, args.tolerance)
+        for failure in failures:
+            print(f"REGRESSION {failure}")
+        if failures:
+            status = 1
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
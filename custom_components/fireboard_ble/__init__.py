@@ -1,12 +1,49 @@
 """The FireBoard BLE integration."""
+import contextlib
+
 from homeassistant.core import HomeAssistant
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.typing import ConfigType
+
+from .const import DOMAIN, HANDOFF_KEY
+from .services import async_setup_services
+from .websocket import async_setup_websocket
+
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up the FireBoard BLE integration."""
+    async_setup_websocket(hass)
+    async_setup_services(hass)
+    return True
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up the FireBoard sensors."""
     await hass.config_entries.async_forward_entry_setups(entry, ["sensor"])
+    entry.async_on_unload(entry.add_update_listener(async_reload_entry))
     return True
 
+async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Reload the entry when its options change.
+
+    If only the options changed, the running hub hands its live connection
+    and probe state to the new one instead of reconnecting.
+    """
+    domain_data = hass.data.get(DOMAIN, {})
+    hub = domain_data.get(entry.entry_id)
+    if hub and hub.entry_data == dict(entry.data):
+        handoff = hub.detach()
+        if handoff:
+            domain_data.setdefault(HANDOFF_KEY, {})[entry.entry_id] = handoff
+    await hass.config_entries.async_reload(entry.entry_id)
+    # Setup didn't run (or failed): don't leave the connection dangling
+    stale = domain_data.get(HANDOFF_KEY, {}).pop(entry.entry_id, None)
+    if stale:
+        stale.session.lease.release()
+        with contextlib.suppress(Exception):
+            await stale.session.client.disconnect()
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload the FireBoard sensors."""
     return await hass.config_entries.async_unload_platforms(entry, ["sensor"])
\ No newline at end of file
@@ -0,0 +1,179 @@
+"""Probe alarms evaluated on every reading, before the state is written.
+
+Rules come from the options as text, one per line (or separated by ";"),
+in the unit the FireBoard reports:
+
+    1 > 400            channel 1 above 400
+    3 < 225            channel 3 below 225
+    1 rise 15          channel 1 climbing faster than 15 degrees/minute
+    2 outside 220-250  channel 2 leaves the 220-250 band
+"""
+from __future__ import annotations
+
+import math
+import re
+
+from homeassistant.core import HomeAssistant, callback
+
+from .const import DOMAIN
+
+EVENT_ALARM = f"{DOMAIN}_alarm"
+
+KIND_ABOVE = "above"
+KIND_BELOW = "below"
+KIND_RISE = "rise"
+KIND_OUTSIDE = "outside"
+
+# Time constant of the smoothed rate of rise, in seconds
+RATE_TAU = 20
+
+_RULE = re.compile(
+    r"^\s*(?P<channel>\d+)\s*"
+    r"(?:(?P<op>[<>])\s*(?P<limit>-?\d+(?:\.\d+)?)"
+    r"|rise\s+(?P<rate>\d+(?:\.\d+)?)"
+    r"|outside\s+(?P<low>-?\d+(?:\.\d+)?)\s*-\s*(?P<high>-?\d+(?:\.\d+)?))\s*$",
+    re.IGNORECASE,
+)
+
+
+class AlarmRule:
+    """One rule on one channel, with its own trigger state."""
+
+    __slots__ = ("channel", "kind", "low", "high", "text", "active", "fired_at")
+
+    def __init__(self, channel, kind, low=None, high=None) -> None:
+        self.channel = channel
+        self.kind = kind
+        self.low = low
+        self.high = high
+        if kind == KIND_ABOVE:
+            self.text = f"{channel} > {high:g}"
+        elif kind == KIND_BELOW:
+            self.text = f"{channel} < {low:g}"
+        elif kind == KIND_RISE:
+            self.text = f"{channel} rise {high:g}"
+        else:
+            self.text = f"{channel} outside {low:g}-{high:g}"
+        self.active = False
+        self.fired_at = None
+
+    def check(self, value, hysteresis) -> bool | None:
+        """True to trigger, False to clear, None for no change.
+
+        Clearing needs the value back past the limit by `hysteresis`.
+        """
+        low, high = self.low, self.high
+        if not self.active:
+            return (
+                (high is not None and value > high)
+                or (low is not None and value < low)
+            ) or None
+        if (high is None or value <= high - hysteresis) and (low is None or value >= low + hysteresis):
+            return False
+        return None
+
+
+def parse_rules(text: str | None) -> list[AlarmRule]:
+    """Parse the rules option. Raises ValueError naming the bad rule."""
+    rules = []
+    for part in re.split(r"[;\n]", text or ""):
+        if not part.strip():
+            continue
+        match = _RULE.match(part)
+        if not match:
+            raise ValueError(part.strip())
+        channel = int(match["channel"])
+        if match["op"] == ">":
+            rules.append(AlarmRule(channel, KIND_ABOVE, high=float(match["limit"])))
+        elif match["op"] == "<":
+            rules.append(AlarmRule(channel, KIND_BELOW, low=float(match["limit"])))
+        elif match["rate"]:
+            rules.append(AlarmRule(channel, KIND_RISE, high=float(match["rate"])))
+        else:
+            low, high = sorted((float(match["low"]), float(match["high"])))
+            rules.append(AlarmRule(channel, KIND_OUTSIDE, low=low, high=high))
+    return rules
+
+
+class AlarmEngine:
+    """Evaluates the rules for one FireBoard and fires `fireboard_ble_alarm` events.
+
+    Rules are indexed by channel, so channels without rules cost one dict
+    lookup. A rule fires once when it triggers and once when it clears;
+    after firing it stays quiet for `cooldown` seconds.
+    """
+
+    def __init__(self, hass: HomeAssistant, address, name, rules, hysteresis, cooldown) -> None:
+        self.hass = hass
+        self.address = address
+        self.name = name
+        self.hysteresis = hysteresis
+        self.cooldown = cooldown
+        self.fired = 0
+        self._rules: dict[int, list[AlarmRule]] = {}
+        for rule in rules:
+            self._rules.setdefault(rule.channel, []).append(rule)
+        # Channels with a rise rule: (last timestamp, last temp, smoothed degrees/minute)
+        self._rates: dict[int, list] = {
+            channel: [None, None, 0.0]
+            for channel, channel_rules in self._rules.items()
+            if any(rule.kind == KIND_RISE for rule in channel_rules)
+        }
+
+    @callback
+    def evaluate(self, channel, temp, now) -> None:
+        rules = self._rules.get(channel)
+        if rules is None:
+            return
+        rate = None
+        tracker = self._rates.get(channel)
+        if tracker is not None:
+            rate = self._update_rate(tracker, temp, now)
+
+        for rule in rules:
+            if rule.kind == KIND_RISE:
+                if rate is None:
+                    continue
+                change = rule.check(rate, self.hysteresis)
+            else:
+                change = rule.check(temp, self.hysteresis)
+            if change is None:
+                continue
+            if change and rule.fired_at is not None and now - rule.fired_at < self.cooldown:
+                continue
+            rule.active = change
+            if change:
+                rule.fired_at = now
+                self.fired += 1
+            self.hass.bus.async_fire(EVENT_ALARM, {
+                "address": self.address,
+                "name": self.name,
+                "channel": channel,
+                "rule": rule.text,
+                "type": rule.kind,
+                "state": "on" if change else "off",
+                "temp": temp,
+                "rate": None if rate is None else round(rate, 2),
+            })
+
+    @staticmethod
+    def _update_rate(tracker, temp, now):
+        last_ts, last_temp, rate = tracker
+        tracker[0], tracker[1] = now, temp
+        if last_ts is None or now <= last_ts:
+            return None
+        elapsed = now - last_ts
+        instant = (temp - last_temp) / elapsed * 60
+        rate += (1 - math.exp(-elapsed / RATE_TAU)) * (instant - rate)
+        tracker[2] = rate
+        return rate
+
+    @property
+    def rules(self) -> list[AlarmRule]:
+        return [rule for rules in self._rules.values() for rule in rules]
+
+    def reset(self, channel) -> None:
+        """Forget the rate history of a channel (probe unplugged)."""
+        tracker = self._rates.get(channel)
+        if tracker is not None:
+            tracker[:] = [None, None, 0.0]
@@ -0,0 +1,261 @@
+"""Append-only on-disk archive of cook sessions.
+
+One file per session under ``<config>/fireboard_ble/sessions/<mac>/``.
+After the 8-byte magic the file is a sequence of blocks, each holding
+the samples flushed together, stored column by column:
+
+    header   "FBB\\x01", uint32 count, 8 bytes reserved
+    float64  timestamps[count]
+    float32  temperatures[count]
+    uint8    channels[count], zero padded to a multiple of 8
+
+Columns stay aligned, so the reader can map the file and view each
+column in place without copying or parsing it.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import mmap
+import os
+import re
+import struct
+import time
+from array import array
+from bisect import bisect_left, bisect_right
+from typing import NamedTuple
+
+from homeassistant.core import HomeAssistant, callback
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+MAGIC = b"FBSESS\x01\x00"
+BLOCK_MAGIC = b"FBB\x01"
+_BLOCK = struct.Struct("<4sI8x")
+
+SUFFIX = ".fbsess"
+# Start time, plus a counter when several sessions start within a second
+SESSION_ID = re.compile(r"^\d{8}-\d{6}(-\d+)?$")
+
+# Buffered samples are written once there are this many, or this old
+FLUSH_SAMPLES = 1024
+FLUSH_SECONDS = 60
+
+
+def session_dir(hass: HomeAssistant, mac: str) -> str:
+    return hass.config.path(DOMAIN, "sessions", mac.replace(":", "").lower())
+
+
+def session_path(hass: HomeAssistant, mac: str, session_id: str) -> str:
+    if not SESSION_ID.match(session_id):
+        raise ValueError(f"Invalid session id {session_id!r}")
+    return os.path.join(session_dir(hass, mac), session_id + SUFFIX)
+
+
+def _session_order(name: str) -> tuple[str, int]:
+    # "20240601-063000-2" sorts after "20240601-063000" and before "-10"
+    count = name[16:-len(SUFFIX)]
+    return name[:15], int(count) if count.isdigit() else 0
+
+
+class SessionWriter:
+    """Buffers samples on the event loop and appends them as blocks from the executor."""
+
+    def __init__(self, hass: HomeAssistant, mac: str, manual: bool = False) -> None:
+        self.hass = hass
+        self.session_id = self._base_id = time.strftime("%Y%m%d-%H%M%S")
+        self.path = session_path(hass, mac, self.session_id)
+        self.manual = manual
+        self.samples = 0
+        self._ts = array("d")
+        self._temps = array("f")
+        self._channels = array("B")
+        self._oldest = None
+        self._lock = asyncio.Lock()
+        self._flush_pending = False
+        self._started = False
+
+    @callback
+    def append(self, timestamp: float, channel: int, temp: float) -> None:
+        self._ts.append(timestamp)
+        self._temps.append(temp)
+        self._channels.append(channel & 0xFF)
+        self.samples += 1
+        if self._oldest is None:
+            self._oldest = timestamp
+        elif (
+            len(self._ts) >= FLUSH_SAMPLES or timestamp - self._oldest >= FLUSH_SECONDS
+        ) and not self._flush_pending:
+            self._flush_pending = True
+            self.hass.async_create_task(self.async_flush())
+
+    async def async_flush(self) -> None:
+        """Write everything buffered, including samples added while writing."""
+        async with self._lock:
+            self._flush_pending = False
+            while self._ts:
+                ts, temps, channels = self._ts, self._temps, self._channels
+                self._ts, self._temps, self._channels = array("d"), array("f"), array("B")
+                self._oldest = None
+                block = bytearray(_BLOCK.pack(BLOCK_MAGIC, len(ts)))
+                block += ts.tobytes()
+                block += temps.tobytes()
+                block += channels.tobytes()
+                block += bytes(-len(block) % 8)
+                try:
+                    await self.hass.async_add_executor_job(self._write, bytes(block))
+                except OSError as e:
+                    _LOGGER.warning(f"[FireBoard] Session archive write failed: {e}")
+                    return
+
+    def _write(self, block: bytes) -> None:
+        if self._started:
+            with open(self.path, "ab") as archive:
+                archive.write(block)
+            return
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        count = 1
+        while True:
+            # Never append to another session's file
+            try:
+                archive = open(self.path, "xb")
+                break
+            except FileExistsError:
+                count += 1
+                self.session_id = f"{self._base_id}-{count}"
+                self.path = os.path.join(os.path.dirname(self.path), self.session_id + SUFFIX)
+        with archive:
+            archive.write(MAGIC + block)
+        self._started = True
+
+
+class _Block(NamedTuple):
+    offset: int
+    count: int
+    first: float
+    last: float
+
+
+class SessionReader:
+    """Memory-mapped, zero-copy reader for one session file (blocking I/O)."""
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._file = open(path, "rb")
+        size = os.fstat(self._file.fileno()).st_size
+        if size < len(MAGIC):
+            self._file.close()
+            raise ValueError(f"{path} is not a FireBoard session")
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        if self._map[:len(MAGIC)] != MAGIC:
+            self.close()
+            raise ValueError(f"{path} is not a FireBoard session")
+        self._view = memoryview(self._map)
+        self.blocks: list[_Block] = []
+        offset = len(MAGIC)
+        while offset + _BLOCK.size <= size:
+            magic, count = _BLOCK.unpack_from(self._map, offset)
+            end = offset + _BLOCK.size + count * 13
+            end += -end % 8
+            if magic != BLOCK_MAGIC or end > size or not count:
+                break  # truncated tail (session still being written)
+            ts = self._column(offset, count, 0, "d", 8)
+            self.blocks.append(_Block(offset, count, ts[0], ts[-1]))
+            offset = end
+        self._firsts = [block.first for block in self.blocks]
+
+    def _column(self, offset, count, skip, code, size):
+        start = offset + _BLOCK.size + skip
+        return self._view[start:start + count * size].cast(code)
+
+    @property
+    def start(self) -> float | None:
+        return self.blocks[0].first if self.blocks else None
+
+    @property
+    def end(self) -> float | None:
+        return self.blocks[-1].last if self.blocks else None
+
+    @property
+    def samples(self) -> int:
+        return sum(block.count for block in self.blocks)
+
+    def read(self, start=None, end=None, channel=None) -> dict[int, tuple[array, array]]:
+        """{channel: (timestamps, temperatures)} for start <= t <= end."""
+        first = 0 if start is None else max(0, bisect_right(self._firsts, start) - 1)
+        result: dict[int, tuple[array, array]] = {}
+        for block in self.blocks[first:]:
+            if end is not None and block.first > end:
+                break
+            if start is not None and block.last < start:
+                continue
+            count = block.count
+            ts = self._column(block.offset, count, 0, "d", 8)
+            temps = self._column(block.offset, count, 8 * count, "f", 4)
+            channels = self._column(block.offset, count, 12 * count, "B", 1)
+            lo = 0 if start is None else bisect_left(ts, start)
+            hi = count if end is None else bisect_right(ts, end)
+            for index in range(lo, hi):
+                ch = channels[index]
+                if channel is not None and ch != channel:
+                    continue
+                if ch not in result:
+                    result[ch] = (array("d"), array("f"))
+                result[ch][0].append(ts[index])
+                result[ch][1].append(temps[index])
+            del ts, temps, channels
+        return result
+
+    def rows(self, start=None, end=None, channel=None):
+        """(timestamp, channel, temp) in file order, for CSV export."""
+        for block in self.blocks:
+            if (end is not None and block.first > end) or (start is not None and block.last < start):
+                continue
+            count = block.count
+            ts = self._column(block.offset, count, 0, "d", 8)
+            temps = self._column(block.offset, count, 8 * count, "f", 4)
+            channels = self._column(block.offset, count, 12 * count, "B", 1)
+            for index in range(count):
+                t = ts[index]
+                if (start is not None and t < start) or (end is not None and t > end):
+                    continue
+                if channel is not None and channels[index] != channel:
+                    continue
+                yield t, channels[index], temps[index]
+            del ts, temps, channels
+
+    def close(self) -> None:
+        if getattr(self, "_view", None) is not None:
+            self._view.release()
+            self._view = None
+        self._map.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def list_sessions(directory: str) -> list[dict]:
+    """Summaries of the sessions in a device directory (blocking I/O)."""
+    if not os.path.isdir(directory):
+        return []
+    sessions = []
+    for name in sorted((n for n in os.listdir(directory) if n.endswith(SUFFIX)), key=_session_order):
+        path = os.path.join(directory, name)
+        try:
+            with SessionReader(path) as reader:
+                sessions.append({
+                    "session_id": name[:-len(SUFFIX)],
+                    "start": reader.start,
+                    "end": reader.end,
+                    "samples": reader.samples,
+                    "bytes": os.path.getsize(path),
+                })
+        except (OSError, ValueError) as e:
+            _LOGGER.debug(f"[FireBoard] Skipping session file {name}: {e}")
+    return sessions
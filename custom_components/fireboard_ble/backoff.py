@@ -0,0 +1,29 @@
+"""Exponential reconnect backoff with jitter."""
+from __future__ import annotations
+
+import random
+
+
+class Backoff:
+    """Delay doubles per consecutive failure, capped, with jitter.
+
+    The jitter keeps several FireBoards that dropped together (e.g. a proxy
+    rebooted) from retrying in lockstep.
+    """
+
+    __slots__ = ("base", "cap", "jitter", "failures")
+
+    def __init__(self, base: float = 1.0, cap: float = 60.0, jitter: float = 0.5) -> None:
+        self.base = base
+        self.cap = cap
+        self.jitter = jitter
+        self.failures = 0
+
+    def next(self) -> float:
+        """Register a failure and return how long to wait before retrying."""
+        delay = min(self.cap, self.base * (2 ** self.failures))
+        self.failures += 1
+        return delay * random.uniform(1 - self.jitter, 1)
+
+    def reset(self) -> None:
+        self.failures = 0
@@ -0,0 +1,174 @@
+"""Compact binary capture of raw FireBoard traffic.
+
+File layout: the 6-byte magic, then records of
+``<timestamp float64><kind uint8><length uint16><payload>`` (little endian).
+Notification payloads are the raw GATT bytes; advertisement payloads are
+packed by `_pack_advertisement`.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import struct
+import time
+from typing import Iterator, NamedTuple
+
+from homeassistant.core import HomeAssistant, callback
+
+_LOGGER = logging.getLogger(__name__)
+
+MAGIC = b"FBCAP\x01"
+KIND_NOTIFICATION = 1
+KIND_ADVERTISEMENT = 2
+
+_RECORD = struct.Struct("<dBH")
+_U8 = struct.Struct("<B")
+_U16 = struct.Struct("<H")
+
+# Flush to disk once this much is buffered (or on close)
+FLUSH_BYTES = 16 * 1024
+
+
+class CaptureRecord(NamedTuple):
+    timestamp: float
+    kind: int
+    payload: bytes
+
+
+class CapturedAdvertisement(NamedTuple):
+    """Stands in for BluetoothServiceInfoBleak during replay."""
+
+    address: str
+    name: str
+    source: str
+    rssi: int
+    service_data: dict
+    manufacturer_data: dict
+
+
+def _pack_str(value: str) -> bytes:
+    raw = (value or "").encode("utf-8")[:255]
+    return _U8.pack(len(raw)) + raw
+
+
+def _pack_advertisement(service_info) -> bytes:
+    out = bytearray()
+    out += struct.pack("<b", max(-128, min(127, service_info.rssi or -127)))
+    out += _pack_str(service_info.source)
+    out += _pack_str(service_info.name)
+    out += _U8.pack(len(service_info.service_data))
+    for uuid, data in service_info.service_data.items():
+        out += _pack_str(uuid) + _U16.pack(len(data)) + data
+    out += _U8.pack(len(service_info.manufacturer_data))
+    for company, data in service_info.manufacturer_data.items():
+        out += _U16.pack(company) + _U16.pack(len(data)) + data
+    return bytes(out)
+
+
+def unpack_advertisement(address: str, payload: bytes) -> CapturedAdvertisement:
+    offset = 1
+    (rssi,) = struct.unpack_from("<b", payload, 0)
+
+    def read_str():
+        nonlocal offset
+        size = payload[offset]
+        value = payload[offset + 1:offset + 1 + size].decode("utf-8")
+        offset += 1 + size
+        return value
+
+    def read_bytes():
+        nonlocal offset
+        (size,) = _U16.unpack_from(payload, offset)
+        value = payload[offset + 2:offset + 2 + size]
+        offset += 2 + size
+        return value
+
+    source = read_str()
+    name = read_str()
+    service_data = {}
+    count = payload[offset]
+    offset += 1
+    for _ in range(count):
+        uuid = read_str()
+        service_data[uuid] = read_bytes()
+    manufacturer_data = {}
+    count = payload[offset]
+    offset += 1
+    for _ in range(count):
+        (company,) = _U16.unpack_from(payload, offset)
+        offset += 2
+        manufacturer_data[company] = read_bytes()
+    return CapturedAdvertisement(address, name, source, rssi, service_data, manufacturer_data)
+
+
+def read_capture(path: str) -> Iterator[CaptureRecord]:
+    """Yield every record in a capture file (blocking I/O)."""
+    with open(path, "rb") as capture:
+        data = capture.read()
+    if not data.startswith(MAGIC):
+        raise ValueError(f"{path} is not a FireBoard capture")
+    offset = len(MAGIC)
+    size = len(data)
+    while offset + _RECORD.size <= size:
+        timestamp, kind, length = _RECORD.unpack_from(data, offset)
+        offset += _RECORD.size
+        if offset + length > size:
+            break  # truncated tail (capture still being written)
+        yield CaptureRecord(timestamp, kind, data[offset:offset + length])
+        offset += length
+
+
+class CaptureWriter:
+    """Appends raw notifications and advertisements to a capture file.
+
+    Records are buffered in memory on the event loop and written from the
+    executor, so capturing never blocks the notification path.
+    """
+
+    def __init__(self, hass: HomeAssistant, path: str) -> None:
+        self.hass = hass
+        self.path = path
+        self.records = 0
+        self._buffer = bytearray()
+        # One write at a time; a flush waits for the one in progress
+        self._lock = asyncio.Lock()
+        self._flush_pending = False
+        self._started = False
+
+    @callback
+    def notification(self, data) -> None:
+        self._append(KIND_NOTIFICATION, bytes(data))
+
+    @callback
+    def advertisement(self, service_info) -> None:
+        self._append(KIND_ADVERTISEMENT, _pack_advertisement(service_info))
+
+    def _append(self, kind, payload) -> None:
+        self._buffer += _RECORD.pack(time.time(), kind, len(payload))
+        self._buffer += payload
+        self.records += 1
+        if len(self._buffer) >= FLUSH_BYTES and not self._flush_pending:
+            self._flush_pending = True
+            self.hass.async_create_task(self.async_flush())
+
+    async def async_flush(self) -> None:
+        """Write everything buffered, including records added while writing."""
+        async with self._lock:
+            self._flush_pending = False
+            while self._buffer:
+                chunk, self._buffer = self._buffer, bytearray()
+                try:
+                    await self.hass.async_add_executor_job(self._write, bytes(chunk))
+                except OSError as e:
+                    _LOGGER.warning(f"[FireBoard] Capture write failed: {e}")
+                    return
+
+    def _write(self, chunk: bytes) -> None:
+        if not self._started:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            if not os.path.exists(self.path):
+                chunk = MAGIC + chunk
+            self._started = True
+        with open(self.path, "ab") as capture:
+            capture.write(chunk)
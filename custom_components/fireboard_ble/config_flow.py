@@ -12,9 +12,35 @@ from homeassistant.components.bluetooth import (
     async_discovered_service_info,
 )
 from homeassistant.const import CONF_ADDRESS
+from homeassistant.core import callback
 from homeassistant.data_entry_flow import FlowResult
 
-from .const import DOMAIN, CONF_ENABLE_MQTT
+from .const import (
+    DOMAIN,
+    CONF_ENABLE_MQTT,
+    CONF_MQTT_AGGREGATE,
+    CONF_DEADBAND,
+    CONF_MIN_WRITE_INTERVAL,
+    CONF_MAX_WRITE_INTERVAL,
+    CONF_PROBE_TIMEOUT,
+    CONF_CAPTURE,
+    CONF_ALARM_RULES,
+    CONF_ALARM_HYSTERESIS,
+    CONF_ALARM_COOLDOWN,
+    CONF_ETA_TARGETS,
+    CONF_ARCHIVE,
+    CONF_EXCLUDE_RAW,
+    CONF_RSSI_INTERVAL,
+    DEFAULT_DEADBAND,
+    DEFAULT_MIN_WRITE_INTERVAL,
+    DEFAULT_MAX_WRITE_INTERVAL,
+    DEFAULT_PROBE_TIMEOUT,
+    DEFAULT_RSSI_INTERVAL,
+    DEFAULT_ALARM_HYSTERESIS,
+    DEFAULT_ALARM_COOLDOWN,
+)
+from .alarms import parse_rules
+from .eta import parse_targets
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -29,6 +55,14 @@ class FireboardConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         """Initialize the config flow."""
         self._discovery_info: BluetoothServiceInfoBleak | None = None
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(
+        config_entry: config_entries.ConfigEntry,
+    ) -> FireboardOptionsFlow:
+        """Get the options flow for this handler."""
+        return FireboardOptionsFlow(config_entry)
+
     async def async_step_bluetooth(
         self, discovery_info: BluetoothServiceInfoBleak
     ) -> FlowResult:
@@ -150,4 +184,94 @@ class FireboardConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 vol.Required(CONF_ADDRESS): vol.In(discovered_devices),
                 vol.Optional(CONF_ENABLE_MQTT, default=False): bool,
             }),
-        )
\ No newline at end of file
+        )
+
+class FireboardOptionsFlow(config_entries.OptionsFlow):
+    """Handle FireBoard BLE options."""
+
+    def __init__(self, config_entry: config_entries.ConfigEntry) -> None:
+        """Initialize options flow."""
+        self._entry = config_entry
+
+    async def async_step_init(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Manage the options."""
+        errors = {}
+        options = self._entry.options
+        if user_input is not None:
+            try:
+                parse_rules(user_input.get(CONF_ALARM_RULES))
+            except ValueError:
+                errors[CONF_ALARM_RULES] = "invalid_alarm_rule"
+            try:
+                parse_targets(user_input.get(CONF_ETA_TARGETS))
+            except ValueError:
+                errors[CONF_ETA_TARGETS] = "invalid_eta_target"
+            if not errors:
+                return self.async_create_entry(title="", data=user_input)
+            options = {**options, **user_input}
+
+        enable_mqtt = options.get(
+            CONF_ENABLE_MQTT, self._entry.data.get(CONF_ENABLE_MQTT, False)
+        )
+
+        return self.async_show_form(
+            step_id="init",
+            errors=errors,
+            data_schema=vol.Schema({
+                vol.Optional(CONF_ENABLE_MQTT, default=enable_mqtt): bool,
+                vol.Optional(
+                    CONF_MQTT_AGGREGATE,
+                    default=options.get(CONF_MQTT_AGGREGATE, False),
+                ): bool,
+                vol.Optional(
+                    CONF_DEADBAND,
+                    default=options.get(CONF_DEADBAND, DEFAULT_DEADBAND),
+                ): vol.All(vol.Coerce(float), vol.Range(min=0, max=10)),
+                vol.Optional(
+                    CONF_MIN_WRITE_INTERVAL,
+                    default=options.get(CONF_MIN_WRITE_INTERVAL, DEFAULT_MIN_WRITE_INTERVAL),
+                ): vol.All(vol.Coerce(int), vol.Range(min=0, max=600)),
+                vol.Optional(
+                    CONF_MAX_WRITE_INTERVAL,
+                    default=options.get(CONF_MAX_WRITE_INTERVAL, DEFAULT_MAX_WRITE_INTERVAL),
+                ): vol.All(vol.Coerce(int), vol.Range(min=1, max=3600)),
+                vol.Optional(
+                    CONF_PROBE_TIMEOUT,
+                    default=options.get(CONF_PROBE_TIMEOUT, DEFAULT_PROBE_TIMEOUT),
+                ): vol.All(vol.Coerce(int), vol.Range(min=5, max=600)),
+                vol.Optional(
+                    CONF_RSSI_INTERVAL,
+                    default=options.get(CONF_RSSI_INTERVAL, DEFAULT_RSSI_INTERVAL),
+                ): vol.All(vol.Coerce(int), vol.Range(min=5, max=3600)),
+                vol.Optional(
+                    CONF_ALARM_RULES,
+                    default=options.get(CONF_ALARM_RULES, ""),
+                ): str,
+                vol.Optional(
+                    CONF_ALARM_HYSTERESIS,
+                    default=options.get(CONF_ALARM_HYSTERESIS, DEFAULT_ALARM_HYSTERESIS),
+                ): vol.All(vol.Coerce(float), vol.Range(min=0, max=50)),
+                vol.Optional(
+                    CONF_ALARM_COOLDOWN,
+                    default=options.get(CONF_ALARM_COOLDOWN, DEFAULT_ALARM_COOLDOWN),
+                ): vol.All(vol.Coerce(int), vol.Range(min=0, max=3600)),
+                vol.Optional(
+                    CONF_ETA_TARGETS,
+                    default=options.get(CONF_ETA_TARGETS, ""),
+                ): str,
+                vol.Optional(
+                    CONF_ARCHIVE,
+                    default=options.get(CONF_ARCHIVE, False),
+                ): bool,
+                vol.Optional(
+                    CONF_EXCLUDE_RAW,
+                    default=options.get(CONF_EXCLUDE_RAW, False),
+                ): bool,
+                vol.Optional(
+                    CONF_CAPTURE,
+                    default=options.get(CONF_CAPTURE, False),
+                ): bool,
+            }),
+        )
@@ -2,10 +2,56 @@
 
 DOMAIN = "fireboard_ble"
 
+# hass.data[DOMAIN] keys: sessions handed across an options reload, and
+# the runtime shared by every hub
+HANDOFF_KEY = "handoff"
+RUNTIME_KEY = "runtime"
+SLOTS_KEY = "slots"
+
 # UUIDs
 DATA_CHARACTERISTIC_UUID = "c2f780ec-45e1-452b-a879-327e3140d1f1"
 CONTROL_CHARACTERISTIC_UUID = "c2f780ec-45e1-452b-a879-327e3140d1e8"
 
 # Configuration Keys
 CONF_SERIAL = "serial_number"
-CONF_ENABLE_MQTT = "enable_mqtt" # New Key
\ No newline at end of file
+CONF_ENABLE_MQTT = "enable_mqtt" # New Key
+CONF_MQTT_AGGREGATE = "mqtt_aggregate"
+
+# Options (state write policy)
+CONF_DEADBAND = "deadband"
+CONF_MIN_WRITE_INTERVAL = "min_write_interval"
+CONF_MAX_WRITE_INTERVAL = "max_write_interval"
+
+DEFAULT_DEADBAND = 0.2
+DEFAULT_MIN_WRITE_INTERVAL = 5
+DEFAULT_MAX_WRITE_INTERVAL = 60
+
+# Options (probe watchdog)
+CONF_PROBE_TIMEOUT = "probe_timeout"
+
+DEFAULT_PROBE_TIMEOUT = 30
+
+# Options (diagnostics)
+CONF_RSSI_INTERVAL = "rssi_interval"
+
+DEFAULT_RSSI_INTERVAL = 60
+
+# Options (recorder)
+CONF_EXCLUDE_RAW = "exclude_raw_states"
+
+# Options (alarms)
+CONF_ALARM_RULES = "alarm_rules"
+CONF_ALARM_HYSTERESIS = "alarm_hysteresis"
+CONF_ALARM_COOLDOWN = "alarm_cooldown"
+
+DEFAULT_ALARM_HYSTERESIS = 2.0
+DEFAULT_ALARM_COOLDOWN = 300
+
+# Options (cook ETA)
+CONF_ETA_TARGETS = "eta_targets"
+
+# Options (session archive)
+CONF_ARCHIVE = "archive_sessions"
+
+# Options (troubleshooting)
+CONF_CAPTURE = "capture"
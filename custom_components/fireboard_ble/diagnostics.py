@@ -0,0 +1,49 @@
+"""Diagnostics support for FireBoard BLE."""
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_ADDRESS
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN
+
+TO_REDACT = {CONF_ADDRESS}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    data: dict[str, Any] = {
+        "entry": {
+            "data": async_redact_data(dict(entry.data), TO_REDACT),
+            "options": dict(entry.options),
+        },
+    }
+
+    hub = hass.data.get(DOMAIN, {}).get(entry.entry_id)
+    if hub is None:
+        return data
+
+    data["hub"] = {
+        "state": hub.state.value,
+        "probes": sorted(hub.sensors),
+        "parser": hub.parser.stats,
+        "metrics": hub.metrics.as_dict(),
+        "rssi_by_source": hub.slots.sources_for(hub.mac),
+    }
+    if hub.alarms:
+        data["hub"]["alarms"] = {
+            "fired": hub.alarms.fired,
+            "active": [rule.text for rule in hub.alarms.rules if rule.active],
+        }
+    if hub.publisher:
+        data["hub"]["mqtt"] = {
+            "published": hub.publisher.published,
+            "spooled": hub.publisher.spooled,
+            "dropped": hub.publisher.dropped,
+        }
+    return data
@@ -0,0 +1,117 @@
+"""Time-to-target and stall detection from a probe's recent trend."""
+from __future__ import annotations
+
+import re
+from collections import deque
+
+# Regression window and minimum spacing between samples (seconds)
+ETA_WINDOW = 900
+SAMPLE_SPACING = 5
+# Not enough history for a trend until the samples span this much
+MIN_SPAN = ETA_WINDOW / 4
+# Rising slower than this (degrees/minute) for half a window is a stall
+STALL_RATE = 0.1
+# Sums are re-based on a new time origin this often to keep them precise
+REBASE_AFTER = 6 * 3600
+
+_TARGET = re.compile(r"^\s*(\d+)\s*[:=]\s*(-?\d+(?:\.\d+)?)\s*$")
+
+
+def parse_targets(text: str | None) -> dict[int, float]:
+    """Parse "1=203, 2=165". Raises ValueError naming the bad entry."""
+    targets = {}
+    for part in re.split(r"[,;\n]", text or ""):
+        if not part.strip():
+            continue
+        match = _TARGET.match(part)
+        if not match:
+            raise ValueError(part.strip())
+        targets[int(match[1])] = float(match[2])
+    return targets
+
+
+class TrendEstimator:
+    """Least-squares line over a sliding time window.
+
+    Keeps running sums so adding a sample (and expiring old ones) is O(1)
+    amortized; nothing rescans the history.
+    """
+
+    __slots__ = ("window", "spacing", "_samples", "_origin", "_last", "_n", "_st", "_sy", "_stt", "_sty")
+
+    def __init__(self, window: float = ETA_WINDOW, spacing: float = SAMPLE_SPACING) -> None:
+        self.window = window
+        self.spacing = spacing
+        self._samples: deque = deque()
+        self._origin = None
+        self._last = None
+        self._n = 0
+        self._st = self._sy = self._stt = self._sty = 0.0
+
+    def add(self, timestamp: float, temp: float) -> None:
+        if self._last is not None and timestamp - self._last < self.spacing:
+            return
+        self._last = timestamp
+        if self._origin is None:
+            self._origin = timestamp
+        elif timestamp - self._origin > REBASE_AFTER:
+            self._rebase(timestamp)
+
+        t = timestamp - self._origin
+        self._samples.append((t, temp))
+        self._n += 1
+        self._st += t
+        self._sy += temp
+        self._stt += t * t
+        self._sty += t * temp
+
+        cutoff = t - self.window
+        samples = self._samples
+        while samples[0][0] < cutoff:
+            old_t, old_y = samples.popleft()
+            self._n -= 1
+            self._st -= old_t
+            self._sy -= old_y
+            self._stt -= old_t * old_t
+            self._sty -= old_t * old_y
+
+    def _rebase(self, timestamp: float) -> None:
+        shift = timestamp - self._origin - self.window
+        self._origin += shift
+        self._samples = deque((t - shift, y) for t, y in self._samples)
+        self._n = len(self._samples)
+        self._st = sum(t for t, _ in self._samples)
+        self._sy = sum(y for _, y in self._samples)
+        self._stt = sum(t * t for t, _ in self._samples)
+        self._sty = sum(t * y for t, y in self._samples)
+
+    def reset(self) -> None:
+        self.__init__(self.window, self.spacing)
+
+    @property
+    def span(self) -> float:
+        if len(self._samples) < 2:
+            return 0.0
+        return self._samples[-1][0] - self._samples[0][0]
+
+    def slope(self) -> float | None:
+        """Degrees per minute, or None without enough history."""
+        if self.span < MIN_SPAN:
+            return None
+        n = self._n
+        denominator = n * self._stt - self._st * self._st
+        if denominator <= 0:
+            return None
+        return (n * self._sty - self._st * self._sy) / denominator * 60
+
+    def estimate(self, current: float, target: float) -> tuple[float | None, float | None, bool]:
+        """(minutes to target, degrees/minute, stalled)."""
+        rate = self.slope()
+        if rate is None:
+            return None, None, False
+        if current >= target:
+            return 0.0, rate, False
+        stalled = rate < STALL_RATE and self.span >= self.window / 2
+        if rate <= 0 or stalled:
+            return None, rate, stalled
+        return (target - current) / rate, rate, False
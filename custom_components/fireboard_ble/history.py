@@ -0,0 +1,93 @@
+"""Fixed-size in-memory history for each probe."""
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_left, bisect_right
+
+# 12 bytes per sample; at most one sample per HISTORY_SPACING seconds
+# keeps ~18 hours however often the probe reports
+HISTORY_SIZE = 16384
+HISTORY_SPACING = 4
+
+
+class ProbeHistory:
+    """Ring buffer of (timestamp, temperature) samples.
+
+    Timestamps are float64 epoch seconds, temperatures float32. Readings
+    closer than `spacing` seconds to the last sample kept are skipped, so
+    the buffer covers a fixed span of time. Once full, the oldest sample
+    is overwritten.
+    """
+
+    __slots__ = ("capacity", "spacing", "_ts", "_temps", "_next", "_size")
+
+    def __init__(self, capacity: int = HISTORY_SIZE, spacing: float = HISTORY_SPACING) -> None:
+        self.capacity = capacity
+        self.spacing = spacing
+        self._ts = array("d", bytes(8 * capacity))
+        self._temps = array("f", bytes(4 * capacity))
+        self._next = 0
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def append(self, timestamp: float, temp: float) -> None:
+        # _next - 1 is the newest sample (index -1 wraps once full)
+        if self._size and timestamp - self._ts[self._next - 1] < self.spacing:
+            return
+        index = self._next
+        self._ts[index] = timestamp
+        self._temps[index] = temp
+        self._next = (index + 1) % self.capacity
+        if self._size < self.capacity:
+            self._size += 1
+
+    def _ordered(self) -> tuple[array, array]:
+        if self._size < self.capacity:
+            return self._ts[:self._size], self._temps[:self._size]
+        split = self._next
+        return (
+            self._ts[split:] + self._ts[:split],
+            self._temps[split:] + self._temps[:split],
+        )
+
+    def window(self, start: float | None = None, end: float | None = None):
+        """Samples with start <= t <= end, oldest first."""
+        ts, temps = self._ordered()
+        lo = 0 if start is None else bisect_left(ts, start)
+        hi = len(ts) if end is None else bisect_right(ts, end)
+        return ts[lo:hi], temps[lo:hi]
+
+    def downsample(
+        self,
+        start: float | None = None,
+        end: float | None = None,
+        max_points: int = 500,
+    ) -> list[tuple[float, float]]:
+        """Window reduced to at most `max_points` time buckets (mean per bucket)."""
+        ts, temps = self.window(start, end)
+        return downsample(ts, temps, max_points)
+
+
+def downsample(ts, temps, max_points: int = 500) -> list[tuple[float, float]]:
+    """Reduce sorted samples to at most `max_points` time buckets (mean per bucket)."""
+    count = len(ts)
+    if count <= max_points:
+        return [(t, round(v, 2)) for t, v in zip(ts, temps)]
+
+    first, last = ts[0], ts[-1]
+    width = (last - first) / max_points or 1.0
+    points = []
+    index = 0
+    for bucket in range(max_points):
+        bucket_end = first + width * (bucket + 1)
+        stop = count if bucket == max_points - 1 else bisect_right(ts, bucket_end, index)
+        if stop > index:
+            n = stop - index
+            points.append((
+                sum(ts[index:stop]) / n,
+                round(sum(temps[index:stop]) / n, 2),
+            ))
+        index = stop
+    return points
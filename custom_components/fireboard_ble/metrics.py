@@ -0,0 +1,156 @@
+"""Performance counters for a FireBoard hub."""
+from __future__ import annotations
+
+import bisect
+import time
+
+# Seconds. Covers sub-ms inter-arrival jitter up to a slow proxy connect.
+DEFAULT_BUCKETS = (0.005, 0.01, 0.05, 0.1, 0.25, 0.5, 1, 2, 5, 10, 30, 60)
+
+# Seconds of decoded frames the frames-per-second figure is averaged over
+FPS_WINDOW = 10
+
+
+class Histogram:
+    """Fixed-bucket latency histogram."""
+
+    __slots__ = ("buckets", "counts", "count", "total", "min", "max", "last")
+
+    def __init__(self, buckets=DEFAULT_BUCKETS) -> None:
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.min = None
+        self.max = None
+        self.last = None
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.total += value
+        self.last = value
+        if self.min is None or value < self.min:
+            self.min = value
+        if self.max is None or value > self.max:
+            self.max = value
+
+    def as_dict(self) -> dict:
+        labels = [f"<={edge}" for edge in self.buckets] + [f">{self.buckets[-1]}"]
+        return {
+            "count": self.count,
+            "mean": self.total / self.count if self.count else None,
+            "min": self.min,
+            "max": self.max,
+            "last": self.last,
+            "buckets": dict(zip(labels, self.counts)),
+        }
+
+
+class HubMetrics:
+    """Counters and timings for one hub.
+
+    Everything here is updated from the event loop, so plain attributes
+    are enough.
+    """
+
+    def __init__(self) -> None:
+        self.notifications = 0
+        self.connects = 0
+        self.reconnects_by_source: dict[str, int] = {}
+        self.connect_failures = 0
+        self.time_to_connect = Histogram()
+        self.time_to_auth = Histogram()
+        self.time_to_first_notification = Histogram()
+        self.time_to_reconnect = Histogram()
+        self.gatt_cache_hits = 0
+        self.gatt_cache_misses = 0
+        self.inter_arrival = Histogram()
+        # Frames decoded per second, for the last FPS_WINDOW whole seconds
+        # plus the current one (indexed by second % len)
+        self._frame_counts = [0] * (FPS_WINDOW + 1)
+        self._frame_second = None
+        self._last_notification = None
+        self._connected_at = None
+        self._dropped_at = None
+
+    def connect_started(self) -> float:
+        return time.monotonic()
+
+    def connected(self, started: float, source) -> None:
+        self.time_to_connect.observe(time.monotonic() - started)
+        if self.connects:
+            # None: HA didn't tell us which proxy it used
+            source = source or "unattributed"
+            self.reconnects_by_source[source] = self.reconnects_by_source.get(source, 0) + 1
+        self.connects += 1
+
+    def authenticated(self, started: float) -> None:
+        now = time.monotonic()
+        self.time_to_auth.observe(now - started)
+        self._connected_at = now
+        if self._dropped_at is not None:
+            self.time_to_reconnect.observe(now - self._dropped_at)
+            self._dropped_at = None
+
+    def link_lost(self) -> None:
+        """An established session dropped; times the gap until the next one."""
+        self._dropped_at = time.monotonic()
+
+    def connect_failed(self) -> None:
+        self.connect_failures += 1
+
+    def notification(self) -> None:
+        now = time.monotonic()
+        self.notifications += 1
+        if self._connected_at is not None:
+            self.time_to_first_notification.observe(now - self._connected_at)
+            self._connected_at = None
+            self._last_notification = now
+            return
+        last = self._last_notification
+        self._last_notification = now
+        if last is not None:
+            self.inter_arrival.observe(now - last)
+
+    def frames_decoded(self, count: int) -> None:
+        """`count` frames were just decoded from a notification."""
+        if count:
+            second = self._advance()
+            self._frame_counts[second % len(self._frame_counts)] += count
+
+    @property
+    def frames_per_second(self) -> float:
+        """Decoded frames per second over the last FPS_WINDOW seconds; 0 when idle."""
+        second = self._advance()
+        counts = self._frame_counts
+        return (sum(counts) - counts[second % len(counts)]) / FPS_WINDOW
+
+    def _advance(self) -> int:
+        """Move the window to the current second, zeroing the seconds skipped."""
+        second = int(time.monotonic())
+        last = self._frame_second
+        counts = self._frame_counts
+        if last is None or second - last >= len(counts):
+            counts[:] = [0] * len(counts)
+        else:
+            for skipped in range(last + 1, second + 1):
+                counts[skipped % len(counts)] = 0
+        self._frame_second = second
+        return second
+
+    def as_dict(self) -> dict:
+        return {
+            "notifications": self.notifications,
+            "connects": self.connects,
+            "connect_failures": self.connect_failures,
+            "gatt_cache_hits": self.gatt_cache_hits,
+            "gatt_cache_misses": self.gatt_cache_misses,
+            "reconnects_by_source": dict(self.reconnects_by_source),
+            "frames_per_second": round(self.frames_per_second, 3),
+            "time_to_connect": self.time_to_connect.as_dict(),
+            "time_to_auth": self.time_to_auth.as_dict(),
+            "time_to_first_notification": self.time_to_first_notification.as_dict(),
+            "time_to_reconnect": self.time_to_reconnect.as_dict(),
+            "inter_arrival": self.inter_arrival.as_dict(),
+        }
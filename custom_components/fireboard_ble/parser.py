@@ -0,0 +1,188 @@
+"""Streaming parser for FireBoard GATT notifications."""
+from __future__ import annotations
+
+import json
+from typing import NamedTuple
+
+# A single FireBoard frame is ~70 bytes. Anything this large without a
+# closing brace is a lost fragment, not a frame still in flight.
+MAX_FRAME_BYTES = 512
+
+_OPEN = 0x7B  # {
+_CLOSE = 0x7D  # }
+_QUOTE = 0x22  # "
+
+_KEY_CHANNEL = b'"channel"'
+_KEY_TEMP = b'"temp"'
+_KEY_DATE = b'"date"'
+_KEY_DEGREETYPE = b'"degreetype"'
+
+
+class ProbeReading(NamedTuple):
+    """One decoded probe frame."""
+
+    channel: int | None
+    temp: float | None
+    date: str
+    degreetype: int
+
+
+class _FastPathMiss(Exception):
+    """Frame is valid JSON we can't read without the full decoder."""
+
+
+def _find_value(frame: bytes, key: bytes) -> int:
+    """Return the offset of the first byte after `key:` or -1."""
+    idx = frame.find(key)
+    if idx < 0:
+        return -1
+    idx += len(key)
+    colon = frame.find(b":", idx)
+    if colon < 0:
+        raise _FastPathMiss
+    idx = colon + 1
+    while frame[idx] in b" \t\r\n":
+        idx += 1
+    return idx
+
+
+def _number(frame: bytes, key: bytes):
+    """Read a numeric (or null) value without building a dict."""
+    start = _find_value(frame, key)
+    if start < 0:
+        return None
+    end = start
+    size = len(frame)
+    while end < size and frame[end] not in b",} \t\r\n":
+        end += 1
+    token = frame[start:end]
+    if token == b"null":
+        return None
+    if b"." in token or b"e" in token or b"E" in token:
+        return float(token)
+    return int(token)
+
+
+def _string(frame: bytes, key: bytes, default: str) -> str:
+    start = _find_value(frame, key)
+    if start < 0:
+        return default
+    if frame[start] != _QUOTE:
+        raise _FastPathMiss
+    end = frame.find(b'"', start + 1)
+    if end < 0 or frame[end - 1] == 0x5C:  # escaped quote, let json handle it
+        raise _FastPathMiss
+    return frame[start + 1:end].decode("utf-8")
+
+
+def _decode_fast(frame: bytes) -> ProbeReading:
+    if _KEY_CHANNEL not in frame:
+        raise _FastPathMiss
+    channel = _number(frame, _KEY_CHANNEL)
+    temp = _number(frame, _KEY_TEMP)
+    date = _string(frame, _KEY_DATE, "Unknown")
+    degreetype = _number(frame, _KEY_DEGREETYPE)
+    return ProbeReading(channel, temp, date, 2 if degreetype is None else degreetype)
+
+
+def _decode_full(frame: bytes) -> ProbeReading:
+    json_data = json.loads(frame)
+    if not isinstance(json_data, dict):
+        raise ValueError("frame is not an object")
+    return ProbeReading(
+        json_data.get("channel"),
+        json_data.get("temp"),
+        json_data.get("date", "Unknown"),
+        json_data.get("degreetype", 2),
+    )
+
+
+class NotificationParser:
+    """Reassembles JSON frames split across notifications.
+
+    Frames are flat JSON objects. A `{` arriving before the previous frame
+    closed means a fragment was lost; the partial frame is dropped and
+    counted as a resync rather than poisoning the next one.
+    """
+
+    __slots__ = ("_buffer", "frames", "malformed", "resynced")
+
+    def __init__(self) -> None:
+        self._buffer = bytearray()
+        self.frames = 0
+        self.malformed = 0
+        self.resynced = 0
+
+    @property
+    def stats(self) -> dict[str, int]:
+        return {
+            "frames": self.frames,
+            "malformed": self.malformed,
+            "resynced": self.resynced,
+            "buffered_bytes": len(self._buffer),
+        }
+
+    def reset(self) -> None:
+        """Drop any partial frame (e.g. after a reconnect)."""
+        self._buffer.clear()
+
+    def feed(self, data: bytes | bytearray) -> list[ProbeReading]:
+        """Consume one notification and return every completed frame."""
+        # Common case: one whole frame per notification, nothing buffered.
+        # Trailing whitespace (e.g. a line ending) is allowed, as in JSON.
+        if not self._buffer and data and data[0] == _OPEN:
+            frame = bytes(data).rstrip()
+            if frame[-1] == _CLOSE and frame.count(b"{") == 1:
+                reading = self._decode(frame)
+                return [reading] if reading else []
+
+        buf = self._buffer
+        buf += data
+        readings: list[ProbeReading] = []
+
+        while buf:
+            start = buf.find(b"{")
+            if start < 0:
+                # No frame start anywhere: everything buffered is noise,
+                # unless it is just whitespace between frames.
+                if buf.strip():
+                    self.resynced += 1
+                buf.clear()
+                break
+            if start:
+                if buf[:start].strip():
+                    self.resynced += 1
+                del buf[:start]
+
+            end = buf.find(b"}", 1)
+            restart = buf.find(b"{", 1, end if end >= 0 else len(buf))
+            if restart > 0:
+                # The open frame never closed; its tail was lost.
+                self.resynced += 1
+                del buf[:restart]
+                continue
+            if end < 0:
+                if len(buf) > MAX_FRAME_BYTES:
+                    self.malformed += 1
+                    buf.clear()
+                break
+
+            frame = bytes(buf[:end + 1])
+            del buf[:end + 1]
+            reading = self._decode(frame)
+            if reading:
+                readings.append(reading)
+
+        return readings
+
+    def _decode(self, frame: bytes) -> ProbeReading | None:
+        try:
+            try:
+                reading = _decode_fast(frame)
+            except (_FastPathMiss, IndexError, ValueError):
+                reading = _decode_full(frame)
+        except (ValueError, UnicodeDecodeError):
+            self.malformed += 1
+            return None
+        self.frames += 1
+        return reading
@@ -0,0 +1,200 @@
+"""Batched MQTT publishing with an on-disk spool for broker outages."""
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import os
+import time
+
+from homeassistant.components import mqtt
+from homeassistant.core import HomeAssistant, callback
+
+_LOGGER = logging.getLogger(__name__)
+
+QUEUE_SIZE = 256
+BATCH_WINDOW = 0.25
+SPOOL_MAX_BYTES = 1024 * 1024
+
+
+class MqttPublisher:
+    """Per-hub MQTT stage.
+
+    Readings are queued without blocking the notification path and
+    published from a single worker task. While the broker is unreachable,
+    messages are appended to a spool file and replayed in order once it
+    comes back.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        base_topic: str,
+        spool_path: str,
+        aggregate: bool = False,
+    ) -> None:
+        self.hass = hass
+        self.base_topic = base_topic
+        self.aggregate = aggregate
+        self.spool_path = spool_path
+        self.state_topic = f"{base_topic}/state"
+        self._topics: dict = {0: f"{base_topic}/ambient"}
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=QUEUE_SIZE)
+        # Checked for a leftover spool when the worker starts
+        self._spooled = False
+
+        self.published = 0
+        self.spooled = 0
+        self.dropped = 0
+
+    def topic_for(self, channel) -> str:
+        topic = self._topics.get(channel)
+        if topic is None:
+            topic = self._topics[channel] = f"{self.base_topic}/probe{channel}"
+        return topic
+
+    @callback
+    def publish(self, channel, temp) -> None:
+        """Queue a reading. Never blocks; drops the oldest on overflow."""
+        item = (time.time(), channel, temp)
+        try:
+            self._queue.put_nowait(item)
+        except asyncio.QueueFull:
+            self._queue.get_nowait()
+            self._queue.put_nowait(item)
+            self.dropped += 1
+
+    async def run(self) -> None:
+        """Worker loop: batch, publish, spool on failure."""
+        self._spooled = await self.hass.async_add_executor_job(os.path.exists, self.spool_path)
+        while True:
+            batch = [await self._queue.get()]
+            await asyncio.sleep(BATCH_WINDOW)
+            while not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+
+            messages = self._build_messages(batch)
+
+            if not self._broker_ready():
+                await self._spool(messages)
+                continue
+
+            if self._spooled and not await self._drain_spool():
+                await self._spool(messages)
+                continue
+
+            for index, (topic, payload, _) in enumerate(messages):
+                if not await self._send(topic, payload):
+                    await self._spool(messages[index:])
+                    break
+
+    def _build_messages(self, batch) -> list[tuple[str, str, float]]:
+        """(topic, payload, reading time) for each message."""
+        if not self.aggregate:
+            return [(self.topic_for(ch), str(temp), ts) for ts, ch, temp in batch]
+
+        # One message per device cycle, latest value per channel wins.
+        readings = {}
+        for ts, ch, temp in batch:
+            readings[self.topic_for(ch).rsplit("/", 1)[1]] = temp
+        payload = json.dumps({"timestamp": round(batch[-1][0], 3), **readings})
+        return [(self.state_topic, payload, batch[-1][0])]
+
+    def _broker_ready(self) -> bool:
+        try:
+            return mqtt.is_connected(self.hass)
+        except Exception:
+            return False
+
+    async def _send(self, topic, payload) -> bool:
+        try:
+            await mqtt.async_publish(self.hass, topic, payload, 0, False)
+        except Exception as e:
+            _LOGGER.debug(f"[FireBoard] MQTT publish to {topic} failed: {e}")
+            return False
+        self.published += 1
+        return True
+
+    async def _spool(self, messages) -> None:
+        try:
+            written = await self.hass.async_add_executor_job(self._append_spool, messages)
+        except OSError as e:
+            _LOGGER.warning(f"[FireBoard] Could not spool {len(messages)} MQTT messages: {e}")
+            written = 0
+        self.spooled += written
+        self.dropped += len(messages) - written
+        if written:
+            self._spooled = True
+
+    def _append_spool(self, messages) -> int:
+        try:
+            size = os.path.getsize(self.spool_path)
+        except OSError:
+            size = 0
+        lines = []
+        for topic, payload, ts in messages:
+            line = f"{ts:.3f}\t{topic}\t{payload}\n"
+            size += len(line)
+            if size > SPOOL_MAX_BYTES:
+                break
+            lines.append(line)
+        if lines:
+            with open(self.spool_path, "a", encoding="utf-8") as spool:
+                spool.writelines(lines)
+        return len(lines)
+
+    async def _drain_spool(self) -> bool:
+        """Publish spooled messages oldest first. Returns True once empty."""
+        lines = await self.hass.async_add_executor_job(self._read_spool)
+        for index, line in enumerate(lines):
+            topic, payload = self._replay_message(line)
+            if not await self._send(topic, payload):
+                await self._rewrite(lines[index:])
+                return False
+        await self._rewrite([])
+        self._spooled = False
+        _LOGGER.info(f"[FireBoard] Replayed {len(lines)} spooled MQTT messages.")
+        return True
+
+    def _replay_message(self, line) -> tuple[str, str]:
+        """A spooled line as (topic, payload).
+
+        Per-probe values are replayed to `<probe topic>/replay` as
+        {"timestamp": ..., "temp": ...}, so consumers of the live topic
+        keep getting bare numbers and never mistake an old reading for a
+        current one. Aggregated messages carry their timestamp already.
+        """
+        fields = line.rstrip("\n").split("\t", 2)
+        if len(fields) == 2:
+            return fields[0], fields[1]  # spooled before timestamps were kept
+        ts, topic, payload = fields
+        if topic == self.state_topic:
+            return topic, payload
+        try:
+            temp = float(payload)
+        except ValueError:
+            temp = None
+        return f"{topic}/replay", json.dumps({"timestamp": float(ts), "temp": temp})
+
+    async def _rewrite(self, lines) -> None:
+        try:
+            await self.hass.async_add_executor_job(self._rewrite_spool, lines)
+        except OSError as e:
+            _LOGGER.warning(f"[FireBoard] Could not rewrite the MQTT spool: {e}")
+
+    def _read_spool(self) -> list[str]:
+        try:
+            with open(self.spool_path, encoding="utf-8") as spool:
+                return spool.readlines()
+        except OSError:
+            return []
+
+    def _rewrite_spool(self, lines) -> None:
+        if not lines:
+            try:
+                os.remove(self.spool_path)
+            except OSError:
+                pass
+            return
+        with open(self.spool_path, "w", encoding="utf-8") as spool:
+            spool.writelines(lines)
@@ -0,0 +1,158 @@
+"""Replay a capture through a real FireboardHub without hardware.
+
+    transport = ReplayTransport(hass, "/config/fireboard_ble/captures/x.fbcap", speed=60)
+    hub = FireboardHub(hass, entry, mac, name, False, topic, add_entities, transport=transport)
+    stats = await transport.play(hub)
+
+`speed` scales the recorded inter-arrival times; 0 replays as fast as the
+event loop allows.
+"""
+from __future__ import annotations
+
+import asyncio
+import time
+from types import SimpleNamespace
+
+from homeassistant.components.bluetooth import BluetoothChange
+from homeassistant.core import HomeAssistant
+
+from .capture import (
+    KIND_ADVERTISEMENT,
+    KIND_NOTIFICATION,
+    read_capture,
+    unpack_advertisement,
+)
+
+REPLAY_SOURCE = "replay"
+
+# At speed 0, yield to the loop this often so the hub's timers still run
+YIELD_EVERY = 64
+
+
+class ReplayBleakClient:
+    """Just enough of BleakClient for FireboardHub."""
+
+    def __init__(self, address, disconnected_callback) -> None:
+        self.address = address
+        self.is_connected = True
+        self._disconnected_callback = disconnected_callback
+        self._notify = None
+        self.writes: list[tuple[str, bytes]] = []
+
+    async def start_notify(self, char_specifier, callback) -> None:
+        self._notify = callback
+
+    async def stop_notify(self, char_specifier) -> None:
+        self._notify = None
+
+    async def write_gatt_char(self, char_specifier, data, response=False) -> None:
+        self.writes.append((str(char_specifier), bytes(data)))
+
+    async def disconnect(self) -> bool:
+        self.drop()
+        return True
+
+    def deliver(self, payload: bytes) -> bool:
+        if not self.is_connected or self._notify is None:
+            return False
+        self._notify(self, bytearray(payload))
+        return True
+
+    def drop(self) -> None:
+        """Simulate the link going away."""
+        if self.is_connected:
+            self.is_connected = False
+            if self._disconnected_callback:
+                self._disconnected_callback(self)
+
+
+class ReplayTransport:
+    """Bluetooth stand-in that serves one recorded device."""
+
+    def __init__(self, hass: HomeAssistant, path: str | None = None, speed: float = 1.0, records=None) -> None:
+        self.hass = hass
+        self.path = path
+        self.speed = speed
+        self._records = records
+        self.client: ReplayBleakClient | None = None
+        self._callback = None
+        self._connected = asyncio.Event()
+        self._mac = None
+
+    def ble_device_from_address(self, mac):
+        self._mac = mac
+        return SimpleNamespace(address=mac, name="FireBoard", details={"source": REPLAY_SOURCE})
+
+    def scanner_devices(self, mac):
+        return [
+            SimpleNamespace(
+                scanner=SimpleNamespace(source=REPLAY_SOURCE, connector=None),
+                ble_device=self.ble_device_from_address(mac),
+                advertisement=SimpleNamespace(rssi=-60),
+            )
+        ]
+
+    def register_callback(self, callback, mac, mode):
+        self._callback = callback
+
+        def _unregister():
+            self._callback = None
+
+        return _unregister
+
+    def connected_source(self, client):
+        return REPLAY_SOURCE
+
+    async def connect(self, ble_device, mac, disconnected_callback):
+        self.client = ReplayBleakClient(mac, disconnected_callback)
+        self._connected.set()
+        return self.client
+
+    async def _load(self):
+        if self._records is None:
+            self._records = await self.hass.async_add_executor_job(
+                lambda: list(read_capture(self.path))
+            )
+        return self._records
+
+    async def play(self, hub, connect_timeout: float = 30) -> dict:
+        """Run `hub` against the capture and return replay statistics."""
+        records = await self._load()
+        hub.start()
+        stats = {"notifications": 0, "advertisements": 0, "dropped": 0, "wall_seconds": 0.0}
+        started = time.perf_counter()
+
+        try:
+            await asyncio.wait_for(self._connected.wait(), connect_timeout)
+            loop = self.hass.loop
+            anchor = loop.time()
+            first = records[0].timestamp if records else 0.0
+
+            for index, record in enumerate(records):
+                if self.speed:
+                    delay = anchor + (record.timestamp - first) / self.speed - loop.time()
+                    if delay > 0:
+                        await asyncio.sleep(delay)
+                elif index % YIELD_EVERY == 0:
+                    await asyncio.sleep(0)
+
+                if record.kind == KIND_NOTIFICATION:
+                    if self.client and self.client.deliver(record.payload):
+                        stats["notifications"] += 1
+                    else:
+                        stats["dropped"] += 1
+                elif record.kind == KIND_ADVERTISEMENT and self._callback:
+                    self._callback(
+                        unpack_advertisement(self._mac, record.payload),
+                        BluetoothChange.ADVERTISEMENT,
+                    )
+                    stats["advertisements"] += 1
+
+            # Let coalesced writes and the MQTT batch settle
+            await asyncio.sleep(0.5)
+        finally:
+            stats["wall_seconds"] = time.perf_counter() - started
+            hub.stop()
+            if self.client:
+                self.client.drop()
+        return stats
@@ -0,0 +1,69 @@
+"""Smoothed, rate-limited signal strength per Bluetooth source."""
+from __future__ import annotations
+
+# EWMA weight of each new advertisement
+RSSI_ALPHA = 0.3
+# A move of this many dB in the best source is published early...
+RSSI_CHANGE_DB = 6
+# ...but never more often than this
+RSSI_MIN_GAP = 5
+# Sources not heard from for this long are dropped
+SOURCE_EXPIRY = 300
+
+
+class RssiTracker:
+    """EWMA-smoothed RSSI for every proxy that hears one device.
+
+    `update` returns True when the diagnostic sensors should be written:
+    once per `interval`, or early when the strongest source's RSSI moved
+    by RSSI_CHANGE_DB or the strongest source changed.
+    """
+
+    __slots__ = ("interval", "smoothed", "seen", "published_rssi", "published_source", "published_at")
+
+    def __init__(self, interval: float) -> None:
+        self.interval = interval
+        self.smoothed: dict[str, float] = {}
+        self.seen: dict[str, float] = {}
+        self.published_rssi = None
+        self.published_source = None
+        self.published_at = None
+
+    def update(self, source: str, rssi: int, now: float) -> bool:
+        previous = self.smoothed.get(source)
+        self.smoothed[source] = rssi if previous is None else previous + RSSI_ALPHA * (rssi - previous)
+        self.seen[source] = now
+
+        if self.published_at is None:
+            return True
+        elapsed = now - self.published_at
+        if elapsed >= self.interval:
+            return True
+        if elapsed < RSSI_MIN_GAP:
+            return False
+        best_source, best_rssi = self.best()
+        return (
+            best_source != self.published_source
+            or abs(best_rssi - self.published_rssi) >= RSSI_CHANGE_DB
+        )
+
+    def best(self) -> tuple[str | None, float | None]:
+        if not self.smoothed:
+            return None, None
+        source = max(self.smoothed, key=self.smoothed.__getitem__)
+        return source, self.smoothed[source]
+
+    def published(self, now: float) -> tuple[str | None, int | None]:
+        """Record a publish; returns the (source, rounded RSSI) to show."""
+        for source, seen in list(self.seen.items()):
+            if now - seen > SOURCE_EXPIRY:
+                del self.seen[source]
+                self.smoothed.pop(source, None)
+        source, rssi = self.best()
+        self.published_source = source
+        self.published_rssi = rssi
+        self.published_at = now
+        return source, None if rssi is None else round(rssi)
+
+    def as_dict(self) -> dict[str, int]:
+        return {source: round(rssi) for source, rssi in self.smoothed.items()}
@@ -0,0 +1,110 @@
+"""What every FireBoard hub on the host shares."""
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import Callable
+
+from homeassistant.components.bluetooth import BluetoothScanningMode
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.event import async_track_utc_time_change
+
+from .const import DOMAIN, RUNTIME_KEY
+from .scheduler import DeadlineScheduler, ScopedScheduler
+from .statistics import HOUR, import_probe_statistics
+from .transport import BleTransport
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def get_runtime(hass: HomeAssistant) -> FireboardRuntime:
+    """Return the domain-wide runtime, creating it on first use."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if RUNTIME_KEY not in domain_data:
+        domain_data[RUNTIME_KEY] = FireboardRuntime(hass)
+    return domain_data[RUNTIME_KEY]
+
+
+class FireboardRuntime:
+    """One timer heap and one supervisor for all hubs.
+
+    Each hub gets an advertisement callback matched to its own address,
+    so the Bluetooth manager only calls us for our boards. A hub holds no
+    task while it waits: its timers and events put it on the ready queue
+    and the supervisor calls `hub.step()` to decide what it does next.
+    Only a connection attempt in progress runs as a task of its own.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        self.hass = hass
+        self.transport = BleTransport(hass)
+        self.timers = DeadlineScheduler(hass.loop)
+        self.hubs: dict[str, object] = {}
+        # hub -> cancel for its advertisement callback
+        self._listeners: dict[object, Callable] = {}
+        self._ready: dict = {}
+        self._wakeup = asyncio.Event()
+        self._supervisor: asyncio.Task | None = None
+        self._cancel_hourly = None
+
+    def timers_for(self, hub) -> ScopedScheduler:
+        return ScopedScheduler(self.timers, hub)
+
+    @callback
+    def add(self, hub) -> None:
+        """Start routing advertisements to `hub`. It isn't stepped until woken."""
+        self.hubs[hub.mac.upper()] = hub
+        if hub not in self._listeners:
+            # Always active: HA doesn't act on the requested scanning mode
+            self._listeners[hub] = hub.transport.register_callback(
+                hub._handle_bluetooth_event, hub.mac, BluetoothScanningMode.ACTIVE
+            )
+        if self._supervisor is None:
+            self._supervisor = self.hass.async_create_background_task(
+                self._supervise(), "fireboard_supervisor"
+            )
+            # Finished hours go to long-term statistics shortly after the hour
+            self._cancel_hourly = async_track_utc_time_change(
+                self.hass, self._on_hour, minute=0, second=10
+            )
+
+    @callback
+    def remove(self, hub) -> None:
+        address = hub.mac.upper()
+        if self.hubs.get(address) is hub:
+            del self.hubs[address]
+        self._ready.pop(hub, None)
+        cancel = self._listeners.pop(hub, None)
+        if cancel:
+            cancel()
+        if not self.hubs and self._supervisor:
+            self._supervisor.cancel()
+            self._supervisor = None
+            self._cancel_hourly()
+            self._cancel_hourly = None
+
+    @callback
+    def wake(self, hub) -> None:
+        """Have the supervisor step `hub` on its next pass."""
+        self._ready[hub] = None
+        self._wakeup.set()
+
+    async def _supervise(self) -> None:
+        while True:
+            await self._wakeup.wait()
+            self._wakeup.clear()
+            ready, self._ready = self._ready, {}
+            for hub in ready:
+                try:
+                    hub.step()
+                except Exception as e:
+                    _LOGGER.exception(f"[FireBoard] Error stepping {hub.mac}: {e}")
+
+    @callback
+    def _on_hour(self, now) -> None:
+        before = now.timestamp() // HOUR * HOUR
+        for hub in list(self.hubs.values()):
+            try:
+                import_probe_statistics(self.hass, hub, before)
+            except Exception as e:
+                _LOGGER.exception(f"[FireBoard] Statistics import failed for {hub.mac}: {e}")
@@ -0,0 +1,141 @@
+"""Deadline scheduler backing the probe watchdogs and hub wake-ups."""
+from __future__ import annotations
+
+import asyncio
+import heapq
+import logging
+from collections.abc import Callable, Hashable
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class DeadlineScheduler:
+    """Fires a callback for each key once its deadline passes.
+
+    One timer is armed for the earliest deadline. Pushing a deadline later
+    (the common case: a probe reports again) only updates a dict entry;
+    the stale heap entry is re-queued when it surfaces, so a busy probe
+    costs O(1) per reading instead of a timer cancel/re-create.
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop) -> None:
+        self._loop = loop
+        # key -> [deadline, queued_deadline, callback]
+        self._entries: dict[Hashable, list] = {}
+        self._heap: list[tuple[float, int, Hashable]] = []
+        self._seq = 0
+        self._timer: asyncio.TimerHandle | None = None
+        self._timer_at: float | None = None
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key) -> bool:
+        return key in self._entries
+
+    def schedule(self, key: Hashable, delay: float, callback: Callable) -> None:
+        """(Re)arm `key` to fire `callback(key)` after `delay` seconds."""
+        when = self._loop.time() + delay
+        entry = self._entries.get(key)
+        if entry is not None and when >= entry[1]:
+            entry[0] = when
+            entry[2] = callback
+            return
+
+        self._entries[key] = [when, when, callback]
+        self._push(when, key)
+
+    def cancel(self, key: Hashable) -> None:
+        self._entries.pop(key, None)
+        if not self._entries:
+            self._disarm()
+            self._heap.clear()
+
+    def cancel_all(self) -> None:
+        self._entries.clear()
+        self._heap.clear()
+        self._disarm()
+
+    def cancel_if(self, predicate: Callable[[Hashable], bool]) -> None:
+        for key in [key for key in self._entries if predicate(key)]:
+            self.cancel(key)
+
+    def _push(self, when: float, key: Hashable) -> None:
+        self._seq += 1
+        heapq.heappush(self._heap, (when, self._seq, key))
+        if self._timer_at is None or when < self._timer_at:
+            self._arm(when)
+
+    def _arm(self, when: float) -> None:
+        if self._timer:
+            self._timer.cancel()
+        self._timer_at = when
+        self._timer = self._loop.call_at(when, self._fire)
+
+    def _disarm(self) -> None:
+        if self._timer:
+            self._timer.cancel()
+        self._timer = None
+        self._timer_at = None
+
+    def _fire(self) -> None:
+        self._timer = None
+        self._timer_at = None
+        now = self._loop.time()
+        heap = self._heap
+        expired = []
+
+        while heap and heap[0][0] <= now:
+            queued, _, key = heapq.heappop(heap)
+            entry = self._entries.get(key)
+            if entry is None or entry[1] != queued:
+                continue  # cancelled, or superseded by an earlier deadline
+            if entry[0] > now:
+                entry[1] = entry[0]
+                self._seq += 1
+                heapq.heappush(heap, (entry[0], self._seq, key))
+                continue
+            del self._entries[key]
+            expired.append((key, entry[2]))
+
+        if heap:
+            self._arm(heap[0][0])
+
+        # One failing callback must not cost the others their deadline
+        for key, callback in expired:
+            try:
+                callback(key)
+            except Exception as e:
+                _LOGGER.exception(f"[FireBoard] Timer callback for {key} failed: {e}")
+
+
+class ScopedScheduler:
+    """One owner's share of a DeadlineScheduler used by many.
+
+    Keys are namespaced by `scope` and callbacks get the owner's own key
+    back, so the owner uses it like a scheduler of its own.
+    """
+
+    __slots__ = ("_scheduler", "_scope", "_callbacks")
+
+    def __init__(self, scheduler: DeadlineScheduler, scope: Hashable) -> None:
+        self._scheduler = scheduler
+        self._scope = scope
+        # callback -> wrapper taking the scoped key (bound methods compare equal)
+        self._callbacks: dict[Callable, Callable] = {}
+
+    def __contains__(self, key) -> bool:
+        return (self._scope, key) in self._scheduler
+
+    def schedule(self, key: Hashable, delay: float, callback: Callable) -> None:
+        wrapper = self._callbacks.get(callback)
+        if wrapper is None:
+            wrapper = self._callbacks[callback] = lambda scoped: callback(scoped[1])
+        self._scheduler.schedule((self._scope, key), delay, wrapper)
+
+    def cancel(self, key: Hashable) -> None:
+        self._scheduler.cancel((self._scope, key))
+
+    def cancel_all(self) -> None:
+        scope = self._scope
+        self._scheduler.cancel_if(lambda key: key[0] == scope)
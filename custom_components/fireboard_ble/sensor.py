@@ -2,30 +2,21 @@
 from __future__ import annotations
 
 import logging
-import asyncio
-import json
+import contextlib
 import time
-from datetime import timedelta
-
-from bleak import BleakClient
-from bleak_retry_connector import establish_connection
+from enum import Enum
 
 from homeassistant.components.sensor import (
     SensorEntity,
     SensorStateClass,
     SensorDeviceClass,
 )
-from homeassistant.components.bluetooth import (
-    async_ble_device_from_address,
-    async_register_callback,
-    BluetoothCallbackMatcher,
-    BluetoothScanningMode,
-    BluetoothChange
-)
+from homeassistant.components.bluetooth import BluetoothChange
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.helpers import entity_registry as er
 from homeassistant.const import (
     UnitOfTemperature, 
+    UnitOfTime,
     CONF_ADDRESS,
     SIGNAL_STRENGTH_DECIBELS_MILLIWATT,
     EntityCategory,
@@ -33,20 +24,98 @@ from homeassistant.const import (
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.entity import DeviceInfo
-from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.util.unit_conversion import TemperatureConverter
 
 from .const import (
     DOMAIN, 
+    HANDOFF_KEY,
     DATA_CHARACTERISTIC_UUID, 
     CONTROL_CHARACTERISTIC_UUID,
     CONF_SERIAL,
-    CONF_ENABLE_MQTT 
+    CONF_ENABLE_MQTT,
+    CONF_MQTT_AGGREGATE,
+    CONF_PROBE_TIMEOUT,
+    CONF_CAPTURE,
+    CONF_EXCLUDE_RAW,
+    CONF_ALARM_RULES,
+    CONF_ALARM_HYSTERESIS,
+    CONF_ALARM_COOLDOWN,
+    CONF_ETA_TARGETS,
+    CONF_ARCHIVE,
+    DEFAULT_ALARM_HYSTERESIS,
+    DEFAULT_ALARM_COOLDOWN,
+    CONF_RSSI_INTERVAL,
+    DEFAULT_RSSI_INTERVAL,
+    DEFAULT_PROBE_TIMEOUT,
 )
+from .alarms import AlarmEngine, parse_rules
+from .archive import SessionWriter
+from .backoff import Backoff
+from .eta import TrendEstimator, parse_targets
+from .history import ProbeHistory
+from .metrics import HubMetrics
+from .parser import NotificationParser
+from .rssi import RssiTracker
+from .runtime import get_runtime
+from .session import BleSession, HubHandoff
+from .statistics import ProbeStatistics
+from .slots import get_slot_manager
+from .write_policy import WritePolicy, WRITE_NOW
 
 _LOGGER = logging.getLogger(__name__)
 
-# FINAL TIMEOUT: 30 seconds
-TIMEOUT_SECONDS = 30
+# Probe updates landing within this window are written together
+COALESCE_SECONDS = 0.25
+
+# Probe hysteresis: consecutive 0 readings before a probe counts as unplugged,
+# and consecutive good readings before an unplugged probe comes back
+UNPLUG_CONFIRM = 3
+REPLUG_CONFIRM = 2
+
+# How long to wait for a free proxy slot before re-checking the device
+SLOT_WAIT_SECONDS = 30
+
+# Re-check for the device at least this often while it isn't advertising
+SCAN_TIMEOUT = 30
+
+# Time-to-target sensors are recalculated at most this often
+ETA_UPDATE_SECONDS = 30
+
+# Auto-started archive sessions end this long after the last probe goes away
+SESSION_END_GRACE = 600
+SESSION_KEY = "session"
+
+# Shared-timer key for the hub's next step
+WAKE_KEY = "wake"
+
+# Reconnect backoff: 1s, 2s, 4s ... capped at 60s (with jitter)
+BACKOFF_BASE = 1
+BACKOFF_MAX = 60
+
+
+class HubState(Enum):
+    """Connection lifecycle of a FireboardHub."""
+
+    SCANNING = "scanning"
+    WAITING_SLOT = "waiting_slot"
+    CONNECTING = "connecting"
+    AUTHENTICATING = "authenticating"
+    CONNECTED = "connected"
+    DISCONNECTED = "disconnected"
+    PROXY_FULL = "proxy_full"
+    BACKOFF = "backoff"
+    STOPPED = "stopped"
+
+
+STATUS_TEXT = {
+    HubState.SCANNING: "Scanning...",
+    HubState.WAITING_SLOT: "Waiting for Proxy Slot",
+    HubState.CONNECTING: "Connecting",
+    HubState.AUTHENTICATING: "Authenticating",
+    HubState.CONNECTED: "Connected",
+    HubState.DISCONNECTED: "Disconnected",
+    HubState.STOPPED: "Stopped",
+}
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -56,20 +125,7 @@ async def async_setup_entry(
     """Set up FireBoard BLE sensors."""
     address = entry.data[CONF_ADDRESS]
     
-    # STARTUP CLEANUP (Thread-Safe)
-    try:
-        registry = er.async_get(hass)
-        entries = [
-            e for e in registry.entities.values() 
-            if e.config_entry_id == entry.entry_id
-        ]
-        for entity in entries:
-            if "_ch" in entity.unique_id:
-                registry.async_remove(entity.entity_id)
-    except Exception as e:
-        _LOGGER.warning(f"[FireBoard] Cleanup warning: {e}")
-
-    enable_mqtt = entry.data.get(CONF_ENABLE_MQTT, False)
+    enable_mqtt = entry.options.get(CONF_ENABLE_MQTT, entry.data.get(CONF_ENABLE_MQTT, False))
     
     try:
         mac_parts = address.split(":")
@@ -85,31 +141,70 @@ async def async_setup_entry(
 
     hub = FireboardHub(hass, entry, address, device_name, enable_mqtt, mqtt_base_topic, async_add_entities)
     
-    entities = []
+    # STARTUP RESTORE: probes seen before come back unavailable until data arrives
+    # (indexed lookup: only this entry's entities, not the whole registry)
+    registry = er.async_get(hass)
+    for reg_entry in er.async_entries_for_config_entry(registry, entry.entry_id):
+        prefix, sep, channel = reg_entry.unique_id.rpartition("_ch")
+        if not sep or prefix != f"fireboard_{address}":
+            continue
+        try:
+            channel = int(channel)
+        except ValueError:
+            continue
+        hub.sensors[channel] = FireboardProbeSensor(
+            hub, channel, restored=True, unit=reg_entry.unit_of_measurement
+        )
+
+    for channel, target in hub.eta_targets.items():
+        hub.eta_sensors[channel] = FireboardEtaSensor(hub, channel, target)
+
+    # Options reload: pick up the previous instance's live connection
+    handoff = hass.data.get(DOMAIN, {}).get(HANDOFF_KEY, {}).pop(entry.entry_id, None)
+    if handoff:
+        hub.adopt(handoff)
+
+    entities = list(hub.sensors.values())
+    entities.extend(hub.eta_sensors.values())
     entities.append(FireboardRSSISensor(hub))
     entities.append(FireboardStatusSensor(hub))
     entities.append(FireboardSourceSensor(hub))
+    entities.extend(FireboardMetricSensor(hub, key) for key in METRIC_SENSORS)
     
     async_add_entities(entities)
     
-    entry.async_create_background_task(hass, hub.start(), "fireboard_loop")
+    hass.data.setdefault(DOMAIN, {})[entry.entry_id] = hub
+    entry.async_on_unload(lambda: hass.data[DOMAIN].pop(entry.entry_id, None))
+
+    hub.start()
+    if hub.publisher:
+        entry.async_create_background_task(hass, hub.publisher.run(), "fireboard_mqtt")
     entry.async_on_unload(hub.stop)
-    
-    # Watchdog runs every 10 seconds
-    entry.async_on_unload(
-        async_track_time_interval(hass, hub.check_stale_sensors, timedelta(seconds=10))
-    )
 
 class FireboardHub:
     """Manages connection, dynamic sensors, and MQTT."""
-    def __init__(self, hass, entry, mac, device_name, enable_mqtt, mqtt_base_topic, add_entities_callback):
+    def __init__(self, hass, entry, mac, device_name, enable_mqtt, mqtt_base_topic, add_entities_callback, transport=None):
         self.hass = hass
+        self.runtime = get_runtime(hass)
+        self.transport = transport or self.runtime.transport
         self.entry = entry
+        # Connection settings this hub was built with (options reloads keep the link)
+        self.entry_data = dict(entry.data)
         self.mac = mac
         self.device_name = device_name
         self.add_entities_callback = add_entities_callback
         self.enable_mqtt = enable_mqtt
         self.mqtt_base_topic = mqtt_base_topic
+        self.publisher = None
+        if enable_mqtt:
+            from .publisher import MqttPublisher
+
+            self.publisher = MqttPublisher(
+                hass,
+                mqtt_base_topic,
+                hass.config.path(".storage", f"{DOMAIN}.{mac.replace(':', '').lower()}.spool"),
+                aggregate=entry.options.get(CONF_MQTT_AGGREGATE, False),
+            )
         
         self.client = None
         self.sensors = {} 
@@ -117,7 +212,64 @@ class FireboardHub:
         self.status_sensor = None
         self.source_sensor = None 
         self._running = True
-        self._cancel_callback = None
+        self.rssi = RssiTracker(entry.options.get(CONF_RSSI_INTERVAL, DEFAULT_RSSI_INTERVAL))
+        self.state = HubState.SCANNING
+        self.backoff = Backoff(BACKOFF_BASE, BACKOFF_MAX)
+        # The connection attempt in progress; the only task a hub runs
+        self._attempt = None
+        self.parser = NotificationParser()
+        self.metrics = HubMetrics()
+        self.exclude_raw = entry.options.get(CONF_EXCLUDE_RAW, False)
+        self.alarms = None
+        try:
+            rules = parse_rules(entry.options.get(CONF_ALARM_RULES))
+        except ValueError as e:
+            _LOGGER.error(f"[FireBoard] Ignoring alarm rules, can't read '{e}'.")
+            rules = None
+        try:
+            self.eta_targets = parse_targets(entry.options.get(CONF_ETA_TARGETS))
+        except ValueError as e:
+            _LOGGER.error(f"[FireBoard] Ignoring probe targets, can't read '{e}'.")
+            self.eta_targets = {}
+        self.eta_sensors = {}
+        self.auto_archive = entry.options.get(CONF_ARCHIVE, False)
+        self.archive = None
+        self._session_idle = False
+        # Set when a cook is stopped by hand: don't auto-start another until
+        # the probes go away
+        self._archive_held = False
+        if rules:
+            self.alarms = AlarmEngine(
+                hass, mac, device_name, rules,
+                entry.options.get(CONF_ALARM_HYSTERESIS, DEFAULT_ALARM_HYSTERESIS),
+                entry.options.get(CONF_ALARM_COOLDOWN, DEFAULT_ALARM_COOLDOWN),
+            )
+        self.capture = None
+        if entry.options.get(CONF_CAPTURE, False):
+            from .capture import CaptureWriter
+
+            self.capture = CaptureWriter(
+                hass,
+                hass.config.path(
+                    DOMAIN, "captures",
+                    f"{mac.replace(':', '').lower()}-{time.strftime('%Y%m%d-%H%M%S')}.fbcap",
+                ),
+            )
+        self.write_policy = WritePolicy.from_options(entry.options)
+        self.probe_timeout = entry.options.get(CONF_PROBE_TIMEOUT, DEFAULT_PROBE_TIMEOUT)
+        # Watchdog: one deadline per channel, re-armed on every reading, plus
+        # the hub's next step; kept in the heap all hubs share
+        self.watchdog = self.runtime.timers_for(self)
+        self.slots = get_slot_manager(hass)
+        self.session = None
+        self.lease = None
+        # Fast reconnect: proxy that last worked, and GATT handles of
+        # (data, control) resolved on the first session
+        self.last_source = None
+        self.gatt_handles = None
+        self._dirty = set()
+        self._flush_handle = None
+        self._flush_at = 0.0
 
     @property
     def device_info(self) -> DeviceInfo:
@@ -134,138 +286,460 @@ class FireboardHub:
     def register_status_sensor(self, sensor_entity): self.status_sensor = sensor_entity
     def register_source_sensor(self, sensor_entity): self.source_sensor = sensor_entity
 
+    @callback
+    def start(self):
+        """Hand the hub to the runtime, which drives it from here on."""
+        self.runtime.add(self)
+        if self.session:
+            # Session handed over by the previous instance (options reload)
+            _LOGGER.info(f"[FireBoard] Resuming the existing connection to {self.mac}")
+            self._set_state(HubState.CONNECTED)
+            self.runtime.wake(self)
+        else:
+            self.runtime.wake(self)
+
     def stop(self):
         self._running = False
-        if self._cancel_callback:
-            self._cancel_callback()
+        self.runtime.remove(self)
+        if self._attempt:
+            self._attempt.cancel()
+            self._attempt = None
+        if self._flush_handle:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        self.watchdog.cancel_all()
+        if self.capture:
+            self.hass.async_create_task(self.capture.async_flush())
+        if self.archive:
+            self.hass.async_create_task(self.archive.async_flush())
+        # Free the proxy slot now; a cancelled attempt may not get to it
+        if self.session:
+            self._close(self.session)
+        elif self.lease:
+            self.lease.release()
+            self.lease = None
+        self.state = HubState.STOPPED
+
+    @callback
+    def request_write(self, sensor):
+        """Queue a probe for the next coalesced state write."""
+        self._dirty.add(sensor)
+        flush_at = self.hass.loop.time() + COALESCE_SECONDS
+        if self._flush_handle and self._flush_at <= flush_at:
+            return
+        if self._flush_handle:
+            self._flush_handle.cancel()
+        self._flush_at = flush_at
+        self._flush_handle = self.hass.loop.call_at(flush_at, self._flush_writes)
+
+    @callback
+    def _flush_writes(self):
+        """Write every queued probe the policy allows; re-queue the rest."""
+        self._flush_handle = None
+        dirty, self._dirty = self._dirty, set()
+        now = time.monotonic()
+        retry = None
+
+        for sensor in dirty:
+            if sensor.hass is None:
+                continue
+            delay = sensor.write_if_due(self.write_policy, now)
+            if delay:
+                self._dirty.add(sensor)
+                retry = delay if retry is None else min(retry, delay)
+
+        if retry is not None:
+            self._flush_at = self.hass.loop.time() + retry
+            self._flush_handle = self.hass.loop.call_at(self._flush_at, self._flush_writes)
 
     def update_status(self, status):
         if self.status_sensor: self.status_sensor.update_status(status)
 
-    async def check_stale_sensors(self, now=None):
-        """The Cleaner: Runs on Main Event Loop (Thread-Safe)."""
-        current_time = time.time()
-        to_remove = []
+    @callback
+    def _on_probe_timeout(self, channel):
+        """The Cleaner: fired by the watchdog the moment a probe's deadline passes."""
+        self.expire_sensor(channel)
 
-        for channel, sensor in self.sensors.items():
-            age = current_time - sensor.last_update
-            if age > TIMEOUT_SECONDS:
-                to_remove.append(channel)
-        
-        for channel in to_remove:
-            _LOGGER.warning(f"[FireBoard] Probe {channel} TIMEOUT (> {TIMEOUT_SECONDS}s). REMOVING.")
-            sensor = self.sensors.pop(channel)
-            
-            try:
-                # 1. Update state to unavailable FIRST
-                sensor.mark_unavailable()
-                
-                # 2. Force remove from registry
-                registry = er.async_get(self.hass)
-                if sensor.registry_entry:
-                    registry.async_remove(sensor.entity_id)
-                else:
-                    await sensor.async_remove()
-                    
-            except Exception as e:
-                _LOGGER.error(f"[FireBoard] Removal Error: {e}")
+    def probe_lost(self, channel):
+        """A probe went unavailable (unplugged or timed out)."""
+        eta = self.eta_sensors.get(channel)
+        if eta:
+            eta.probe_lost()
+        if any(sensor.available for sensor in self.sensors.values()):
+            return
+        self._archive_held = False
+        if self.archive and not self.archive.manual:
+            self._session_idle = True
+            self.watchdog.schedule(SESSION_KEY, SESSION_END_GRACE, self._on_session_idle)
 
-    async def remove_sensor_immediate(self, channel):
-        if channel in self.sensors:
-            _LOGGER.warning(f"[FireBoard] Probe {channel} Unplugged (0 received). Removing.")
-            sensor = self.sensors.pop(channel)
-            try:
-                 registry = er.async_get(self.hass)
-                 if sensor.registry_entry:
-                     registry.async_remove(sensor.entity_id)
-                 else:
-                     await sensor.async_remove()
-            except Exception:
-                await sensor.async_remove()
+    def start_session(self, manual=False):
+        """Start archiving readings to a new session file (no-op if one is open)."""
+        if manual:
+            self._archive_held = False
+        if self.archive is None:
+            self.archive = SessionWriter(self.hass, self.mac, manual)
+            _LOGGER.info(f"[FireBoard] Cook session {self.archive.session_id} started.")
+        elif manual:
+            self.archive.manual = True
+        return self.archive
+
+    async def async_stop_session(self, manual=False):
+        """End the open session; a manual stop also holds off auto-start for this cook."""
+        if manual and self.auto_archive and any(sensor.available for sensor in self.sensors.values()):
+            self._archive_held = True
+        archive = self._take_archive()
+        if archive:
+            await archive.async_flush()
+            _LOGGER.info(f"[FireBoard] Cook session {archive.session_id} ended ({archive.samples} readings).")
+
+    def _take_archive(self):
+        archive, self.archive = self.archive, None
+        if self._session_idle:
+            self._session_idle = False
+            self.watchdog.cancel(SESSION_KEY)
+        return archive
+
+    @callback
+    def _on_session_idle(self, key):
+        self._session_idle = False
+        self.hass.async_create_task(self.async_stop_session())
+
+    def expire_sensor(self, channel):
+        # The entity stays registered (same entity_id, history and automations);
+        # it just goes unavailable until the probe reports again.
+        sensor = self.sensors.get(channel)
+        if sensor and sensor.available:
+            _LOGGER.warning(f"[FireBoard] Probe {channel} TIMEOUT (> {self.probe_timeout}s). Marking unavailable.")
+            sensor.mark_unavailable()
 
     @callback
     def _handle_bluetooth_event(self, service_info, change: BluetoothChange):
-        if self.rssi_sensor and service_info.rssi != -100:
-            self.rssi_sensor.update_rssi(service_info.rssi)
-        
+        if self.capture:
+            self.capture.advertisement(service_info)
+        rssi = service_info.rssi
+        if rssi is not None and rssi != -100:
+            due = self.rssi.update(service_info.source, rssi, time.monotonic())
+            self.slots.note_advertisement(self.mac, service_info.source, self.rssi.smoothed[service_info.source])
+        else:
+            due = False
+            self.slots.note_advertisement(self.mac, service_info.source, rssi)
+        if self.state is HubState.SCANNING:
+            self.runtime.wake(self)
+
+        if due:
+            self._publish_rssi()
+
+    def _publish_rssi(self):
+        """Write the smoothed RSSI and source sensors (rate limited by RssiTracker)."""
+        best_source, rssi = self.rssi.published(time.monotonic())
+        if self.rssi_sensor and rssi is not None:
+            self.rssi_sensor.update_rssi(rssi, self.rssi.as_dict())
         if self.source_sensor:
-            self.source_sensor.update_source(service_info.source)
-
-    async def start(self):
-        self._cancel_callback = async_register_callback(
-            self.hass,
-            self._handle_bluetooth_event,
-            BluetoothCallbackMatcher(address=self.mac),
-            BluetoothScanningMode.ACTIVE
-        )
+            # While connected, show the proxy holding the GATT session if
+            # it is known, otherwise the strongest one hearing the board
+            source = best_source
+            if self.session and self.session.source and self.state is HubState.CONNECTED:
+                source = self.session.source
+            if source:
+                self.source_sensor.update_source(source)
 
-        while self._running:
-            self.client = None
-            
-            device = async_ble_device_from_address(self.hass, self.mac, connectable=True)
-            if not device:
-                self.update_status("Scanning...")
-                await asyncio.sleep(5)
-                continue
+    @callback
+    def step(self):
+        """Decide what the hub does next.
+
+        Run by the runtime's supervisor whenever the hub is woken: by its
+        timer, an advertisement while scanning, a dropped link or the end
+        of a connection attempt.
+        """
+        if not self._running or self._attempt:
+            return
+        self.watchdog.cancel(WAKE_KEY)
+        session = self.session
+        if session:
+            if self.state is HubState.CONNECTED and session.client.is_connected:
+                return
+            self._close(session)
+
+        if not self.transport.ble_device_from_address(self.mac):
+            # The next advertisement wakes us sooner
+            self._set_state(HubState.SCANNING)
+            self._sleep(SCAN_TIMEOUT)
+        else:
+            # Wait our turn for a proxy with a free slot (shared by all FireBoards)
+            self._set_state(HubState.WAITING_SLOT)
+            self._attempt = self.hass.async_create_background_task(
+                self._connect_once(), "fireboard_connect"
+            )
+
+    def _sleep(self, delay):
+        """Step again after `delay` seconds, unless woken sooner."""
+        self.watchdog.schedule(WAKE_KEY, delay, self._on_wake)
+
+    @callback
+    def _on_wake(self, key):
+        self.runtime.wake(self)
 
-            self.update_status("Connecting")
+    async def _connect_once(self):
+        """Get a slot, connect and subscribe; the hub is stepped again when done."""
+        retry_delay = 0
+        try:
+            lease = self.lease = await self.slots.acquire(
+                self.mac, self.transport, SLOT_WAIT_SECONDS, prefer=self.last_source
+            )
+            if not lease:
+                return
+
+            self._set_state(HubState.CONNECTING)
+            session = None
+            started = self.metrics.connect_started()
             try:
-                self.client = await establish_connection(
-                    BleakClient, 
-                    device, 
-                    self.mac, 
-                    disconnected_callback=self._on_disconnect,
-                    use_services_cache=True,
-                )
-                self.update_status("Authenticating")
-                
-                await self.client.start_notify(DATA_CHARACTERISTIC_UUID, self._handle_notification)
-                await self.client.write_gatt_char(CONTROL_CHARACTERISTIC_UUID, b'\x01')
-                
-                self.update_status("Connected")
+                session = await self._open(BleSession(self, lease))
+                session.source = self.transport.connected_source(session.client) or self._only_source()
+                self._bind(session)
+                self.slots.mark_connected(session.lease)
+                self.metrics.connected(started, session.source)
+                self._set_state(HubState.AUTHENTICATING)
+                self.parser.reset()
+
+                auth_started = self.metrics.connect_started()
+                await self._subscribe()
+                self.metrics.authenticated(auth_started)
+
+                self.last_source = session.source
+                self._set_state(HubState.CONNECTED)
+                self.backoff.reset()
                 _LOGGER.info(f"[FireBoard] Successfully connected to {self.mac}")
-                
-                while self._running and self.client and self.client.is_connected:
-                    await asyncio.sleep(2)
-                    
+
             except Exception as e:
+                self.metrics.connect_failed()
                 error_text = str(e)
-                if "connection slot" in error_text or "No backend" in error_text:
-                    _LOGGER.error(f"[FireBoard] PROXY FULL: Waiting 60s.")
-                    self.update_status("Proxy Full (Waiting 60s)")
-                    await asyncio.sleep(60) 
+                slot_error = "connection slot" in error_text or "No backend" in error_text
+                full = self._only_source() if slot_error else None
+                if full:
+                    # Park this proxy; the next acquire() hands us another one
+                    # if any has room, otherwise waits for the cooldown.
+                    _LOGGER.error(f"[FireBoard] PROXY FULL: {full}.")
+                    self._set_state(HubState.PROXY_FULL, full)
+                    self.slots.mark_full(full)
+                elif slot_error:
+                    # HA chose the proxy and doesn't say which: parking our
+                    # guess could sideline a healthy one, so back off instead.
+                    retry_delay = self.backoff.next()
+                    _LOGGER.error(f"[FireBoard] PROXY FULL: {error_text}")
                 else:
+                    retry_delay = self.backoff.next()
                     _LOGGER.warning(f"[FireBoard] Connection failed: {error_text}")
-                    self.update_status("Retrying (15s)...")
-                    await asyncio.sleep(15) 
-            
-            if self.client:
-                try:
-                    await self.client.disconnect()
-                except Exception:
-                    pass
-                self.client = None
+
+            if session is None:
+                lease.release()
+                self.lease = None
+            elif self.state is not HubState.CONNECTED:
+                self._close(session)
+        finally:
+            self._attempt = None
+            if self._running:
+                if retry_delay:
+                    self._set_state(HubState.BACKOFF, retry_delay)
+                    self._sleep(retry_delay)
+                else:
+                    self.runtime.wake(self)
+
+    def _only_source(self):
+        """The source HA must have used: the only connectable one hearing the board."""
+        sources = {device.scanner.source for device in self.transport.scanner_devices(self.mac)}
+        return sources.pop() if len(sources) == 1 else None
+
+    def _bind(self, session):
+        session.hub = self
+        self.session = session
+        self.client = session.client
+        self.lease = session.lease
+
+    def _close(self, session):
+        """Give up `session` and disconnect it in the background."""
+        client = self._release_session(session)
+        if client:
+            self.hass.async_create_background_task(
+                self._disconnect(client), "fireboard_disconnect"
+            )
+
+    async def _disconnect(self, client):
+        with contextlib.suppress(Exception):
+            await client.disconnect()
+
+    def _release_session(self, session):
+        """Give up `session` (unless it was handed on); returns the client to disconnect."""
+        if session.hub is not self:
+            return None
+        session.hub = None
+        if self.session is session:
+            self.session = self.client = self.lease = None
+        session.lease.release()
+        return session.client
+
+    def detach(self):
+        """Hand the live session and probe state to the next instance (options reload).
+
+        Returns None when there is no healthy session to hand over.
+        """
+        session = self.session
+        if (
+            session is None
+            or self.state is not HubState.CONNECTED
+            or not session.client.is_connected
+        ):
+            return None
+        # Notifications arriving before the new hub binds the session are dropped
+        session.hub = None
+        self.session = self.client = self.lease = None
+        return HubHandoff(
+            session, self.parser, self.metrics, self.gatt_handles, self.last_source, dict(self.sensors),
+            {channel: sensor.trend for channel, sensor in self.eta_sensors.items()},
+            self._take_archive(), self._archive_held,
+        )
+
+    def adopt(self, handoff):
+        """Take over the session and probe state from the previous instance."""
+        self.parser = handoff.parser
+        self.metrics = handoff.metrics
+        self.gatt_handles = handoff.gatt_handles
+        self.last_source = handoff.last_source
+        for channel, previous in handoff.probes.items():
+            sensor = self.sensors.get(channel)
+            if sensor is None:
+                sensor = self.sensors[channel] = FireboardProbeSensor(self, channel)
+            sensor.adopt(previous)
+            if sensor.available:
+                self.watchdog.schedule(channel, self.probe_timeout, self._on_probe_timeout)
+        self.archive = handoff.archive
+        self._archive_held = handoff.archive_held
+        for channel, trend in handoff.trends.items():
+            if channel in self.eta_sensors:
+                self.eta_sensors[channel].trend = trend
+        session = handoff.session
+        if session.client.is_connected:
+            self._bind(session)
+        else:
+            session.lease.release()
+
+    async def _open(self, session):
+        session.client = await self.transport.connect(
+            session.lease.ble_device, self.mac, session.disconnected
+        )
+        return session
+
+    async def _subscribe(self):
+        """Enable notifications and send the start command.
+
+        Uses the cached characteristic handles when we have them, which
+        saves the UUID lookup. If the device rejects them (new firmware,
+        stale proxy cache) the characteristics are looked up by UUID on the
+        same connection. Only if that fails too is the service cache
+        cleared and the error raised, so the reconnect that follows
+        discovers the services afresh.
+        """
+        if self.gatt_handles:
+            data_handle, control_handle = self.gatt_handles
+            notifying = False
+            try:
+                await self.client.start_notify(data_handle, self.session.notification)
+                notifying = True
+                await self.client.write_gatt_char(control_handle, b'\x01')
+                self.metrics.gatt_cache_hits += 1
+                return
+            except Exception as e:
+                if not self.client.is_connected:
+                    raise
+                _LOGGER.info(f"[FireBoard] Cached GATT handles rejected ({e}), looking the characteristics up again.")
+                self.metrics.gatt_cache_misses += 1
+                self.gatt_handles = None
+                if notifying:
+                    with contextlib.suppress(Exception):
+                        await self.client.stop_notify(data_handle)
+            try:
+                await self._subscribe_by_uuid()
+            except Exception:
+                if self.client.is_connected and hasattr(self.client, "clear_cache"):
+                    _LOGGER.info("[FireBoard] Characteristics not found, reconnecting to discover services again.")
+                    with contextlib.suppress(Exception):
+                        await self.client.clear_cache()
+                raise
+            return
+
+        await self._subscribe_by_uuid()
+
+    async def _subscribe_by_uuid(self):
+        await self.client.start_notify(DATA_CHARACTERISTIC_UUID, self.session.notification)
+        await self.client.write_gatt_char(CONTROL_CHARACTERISTIC_UUID, b'\x01')
+        self.gatt_handles = self._resolve_handles()
+
+    def _resolve_handles(self):
+        services = getattr(self.client, "services", None)
+        if not services:
+            return None
+        data = services.get_characteristic(DATA_CHARACTERISTIC_UUID)
+        control = services.get_characteristic(CONTROL_CHARACTERISTIC_UUID)
+        if data is None or control is None:
+            return None
+        return data.handle, control.handle
+
+    def _set_state(self, state, detail=None):
+        self.state = state
+        if state is HubState.BACKOFF:
+            self.update_status(f"Retrying ({detail:.0f}s)...")
+        elif state is HubState.PROXY_FULL:
+            self.update_status(f"Proxy Full ({detail})")
+        else:
+            self.update_status(STATUS_TEXT[state])
 
     def _on_disconnect(self, client):
-        self.update_status("Disconnected")
+        if self.state is HubState.CONNECTED:
+            self.metrics.link_lost()
+            self._set_state(HubState.DISCONNECTED)
         _LOGGER.warning("[FireBoard] Device Disconnected.")
+        self.runtime.wake(self)
 
     def _handle_notification(self, sender, data):
-        try:
-            text = data.decode("utf-8")
-            json_data = json.loads(text)
-            
-            channel = json_data.get("channel")
-            temp = json_data.get("temp")
-            device_date = json_data.get("date", "Unknown")
-            degreetype = json_data.get("degreetype", 2)
-            
-            if channel:
-                if temp is None or temp <= 0:
-                    if channel in self.sensors:
-                        self.hass.async_create_task(self.remove_sensor_immediate(channel))
-                
-                elif channel in self.sensors:
+        if self.capture:
+            self.capture.notification(data)
+        self.metrics.notification()
+        malformed = self.parser.malformed
+        readings = self.parser.feed(data)
+        self.metrics.frames_decoded(len(readings))
+        for reading in readings:
+            try:
+                self._process_reading(reading)
+            except Exception as e:
+                _LOGGER.debug(f"[FireBoard] Failed to process {reading}: {e}")
+
+        if self.parser.malformed != malformed:
+            _LOGGER.debug(f"[FireBoard] Dropped malformed frame from {self.mac} ({self.parser.stats})")
+
+    def _process_reading(self, reading):
+        channel, temp, device_date, degreetype = reading
+
+        if channel:
+            if temp is None or temp <= 0:
+                sensor = self.sensors.get(channel)
+                if sensor and sensor.note_unplugged():
+                    _LOGGER.warning(f"[FireBoard] Probe {channel} Unplugged (0 received). Marking unavailable.")
+                    self.watchdog.cancel(channel)
+                    if self.alarms:
+                        self.alarms.reset(channel)
+
+            else:
+                # Alarms first: they don't wait for the (rate limited) state write
+                if self.alarms:
+                    self.alarms.evaluate(channel, temp, time.monotonic())
+                archive = self.archive
+                if archive is None and self.auto_archive and not self._archive_held:
+                    archive = self.start_session()
+                if archive:
+                    archive.append(time.time(), channel, temp)
+                    if self._session_idle:
+                        self._session_idle = False
+                        self.watchdog.cancel(SESSION_KEY)
+                if channel in self.sensors:
                     self.sensors[channel].update_temp(temp, degreetype, device_date)
                 else:
                     _LOGGER.info(f"[FireBoard] New probe detected on Channel {channel}.")
@@ -273,59 +747,186 @@ class FireboardHub:
                     self.sensors[channel] = new_sensor
                     self.add_entities_callback([new_sensor])
                     new_sensor.update_temp(temp, degreetype, device_date)
+                self.watchdog.schedule(channel, self.probe_timeout, self._on_probe_timeout)
 
-            if self.enable_mqtt and self.hass.services.has_service("mqtt", "publish"):
-                specific_topic = f"{self.mqtt_base_topic}/probe{channel}"
-                if channel == 0: specific_topic = f"{self.mqtt_base_topic}/ambient"
-                payload = str(temp)
-                self.hass.create_task(
-                    self.hass.services.async_call(
-                        "mqtt", "publish", 
-                        {"topic": specific_topic, "payload": payload, "qos": 0, "retain": False}
-                    )
-                )
-
-        except Exception:
-            pass
+        if self.publisher and channel is not None:
+            self.publisher.publish(channel, temp)
 
 class FireboardProbeSensor(SensorEntity):
+    _attr_should_poll = False
     _attr_state_class = SensorStateClass.MEASUREMENT
     _attr_device_class = SensorDeviceClass.TEMPERATURE
     _attr_has_entity_name = True
     _attr_icon = "mdi:thermometer"
+    # Changes with every reading; would add an attributes row per state
+    _unrecorded_attributes = frozenset({"device_time"})
     
-    def __init__(self, hub, channel):
+    def __init__(self, hub, channel, restored=False, unit=None):
         self._hub = hub
         self._channel = channel
         self._attr_unique_id = f"fireboard_{hub.mac}_ch{channel}"
-        self._attr_native_unit_of_measurement = UnitOfTemperature.FAHRENHEIT
+        self._attr_native_unit_of_measurement = unit or UnitOfTemperature.FAHRENHEIT
         self._attr_name = f"Probe {channel}"
         self._attr_extra_state_attributes = {}
-        self._is_available = True
+        # Restored probes stay unavailable until their first reading
+        self._is_available = not restored
+        self.unplugged = False
+        self._zero_streak = 0
+        self._valid_streak = 0
         self.last_update = time.time()
+        self.history = ProbeHistory()
+        self.stats = ProbeStatistics()
+        if hub.exclude_raw:
+            # Our hourly statistics replace the ones the recorder compiles
+            self._attr_state_class = None
+        self._written_value = None
+        self._written_unit = None
+        self._written_available = None
+        self._written_at = None
     
     @property
     def available(self) -> bool: return self._is_available
 
+    async def async_added_to_hass(self) -> None:
+        # HA writes the initial state as part of adding the entity
+        self._mark_written()
+
     @property
     def device_info(self) -> DeviceInfo:
         return self._hub.device_info
 
     def update_temp(self, temp, degreetype, device_date):
-        if degreetype == 1:
-            self._attr_native_unit_of_measurement = UnitOfTemperature.CELSIUS
-        else:
-            self._attr_native_unit_of_measurement = UnitOfTemperature.FAHRENHEIT
+        unit = UnitOfTemperature.CELSIUS if degreetype == 1 else UnitOfTemperature.FAHRENHEIT
+        if unit != self._attr_native_unit_of_measurement:
+            # Don't mix units within an hour of statistics
+            self.stats.convert(TemperatureConverter.converter_factory(
+                self._attr_native_unit_of_measurement, unit
+            ))
+            self._attr_native_unit_of_measurement = unit
 
         self._attr_extra_state_attributes["device_time"] = device_date
         self._attr_native_value = temp
-        self._is_available = True
         self.last_update = time.time()
-        self.schedule_update_ha_state()
+        self.history.append(self.last_update, temp)
+        self.stats.add(self.last_update, temp)
+        eta = self._hub.eta_sensors.get(self._channel)
+        if eta:
+            eta.add(self.last_update, temp)
+        self._zero_streak = 0
+
+        if self.unplugged:
+            # Hysteresis: a probe that was unplugged must report steadily
+            # before it comes back, so a loose jack doesn't flap the state.
+            self._valid_streak += 1
+            if self._valid_streak < REPLUG_CONFIRM:
+                return
+            self.unplugged = False
+
+        self._is_available = True
+        self._hub.request_write(self)
+
+    def note_unplugged(self):
+        """Count a 0 reading; returns True when the probe is declared unplugged."""
+        self._valid_streak = 0
+        self._zero_streak += 1
+        if self.unplugged or self._zero_streak < UNPLUG_CONFIRM:
+            return False
+        self.unplugged = True
+        if self._is_available:
+            self.mark_unavailable()
+        return True
+
+    def write_if_due(self, policy, now):
+        """Write state if the policy allows it; return the retry delay otherwise."""
+        forced = (
+            self._written_unit != self._attr_native_unit_of_measurement
+            or self._written_available != self._is_available
+        )
+        delay = policy.evaluate(
+            self._written_value, self._written_at, self._attr_native_value, now, forced
+        )
+        if delay == WRITE_NOW:
+            self.async_write_ha_state()
+            self._mark_written()
+        return delay
+
+    def _mark_written(self):
+        self._written_value = self._attr_native_value
+        self._written_unit = self._attr_native_unit_of_measurement
+        self._written_available = self._is_available
+        self._written_at = time.monotonic()
+
+    def adopt(self, previous):
+        """Carry state over from this probe's entity in the previous hub instance."""
+        self._attr_native_value = previous._attr_native_value
+        self._attr_native_unit_of_measurement = previous._attr_native_unit_of_measurement
+        self._attr_extra_state_attributes = dict(previous._attr_extra_state_attributes)
+        self._is_available = previous._is_available
+        self.unplugged = previous.unplugged
+        self._zero_streak = previous._zero_streak
+        self._valid_streak = previous._valid_streak
+        self.last_update = previous.last_update
+        self.history = previous.history
+        self.stats = previous.stats
         
     def mark_unavailable(self):
         self._is_available = False
         self.schedule_update_ha_state()
+        self._written_available = False
+        self._hub.probe_lost(self._channel)
+
+class FireboardEtaSensor(SensorEntity):
+    """Minutes until a probe reaches its target, from its recent trend."""
+    _attr_should_poll = False
+    _attr_device_class = SensorDeviceClass.DURATION
+    _attr_native_unit_of_measurement = UnitOfTime.MINUTES
+    _attr_suggested_display_precision = 0
+    _attr_has_entity_name = True
+    _attr_icon = "mdi:timer-sand"
+    _unrecorded_attributes = frozenset({"rate_per_minute"})
+
+    def __init__(self, hub, channel, target):
+        self._hub = hub
+        self._channel = channel
+        self.target = target
+        self.trend = TrendEstimator()
+        self._attr_unique_id = f"fireboard_{hub.mac}_ch{channel}_eta"
+        self._attr_name = f"Probe {channel} Time To Target"
+        self._attr_extra_state_attributes = {"target": target, "rate_per_minute": None, "stalled": False}
+        self._updated_at = 0.0
+
+    @property
+    def available(self) -> bool:
+        probe = self._hub.sensors.get(self._channel)
+        return probe is not None and probe.available
+
+    @property
+    def device_info(self) -> DeviceInfo:
+        return self._hub.device_info
+
+    def add(self, timestamp, temp):
+        self.trend.add(timestamp, temp)
+        if timestamp - self._updated_at < ETA_UPDATE_SECONDS or self.hass is None:
+            return
+        self._updated_at = timestamp
+        minutes, rate, stalled = self.trend.estimate(temp, self.target)
+        if stalled and not self._attr_extra_state_attributes["stalled"]:
+            _LOGGER.info(f"[FireBoard] Probe {self._channel} stalled at {temp}.")
+        self._attr_native_value = None if minutes is None else round(minutes, 1)
+        self._attr_extra_state_attributes = {
+            "target": self.target,
+            "rate_per_minute": None if rate is None else round(rate, 2),
+            "stalled": stalled,
+        }
+        self.async_write_ha_state()
+
+    def probe_lost(self):
+        """The probe went away: its trend no longer applies."""
+        self.trend.reset()
+        self._attr_native_value = None
+        self._updated_at = 0.0
+        if self.hass is not None:
+            self.async_write_ha_state()
 
 class FireboardRSSISensor(SensorEntity):
     _attr_device_class = SensorDeviceClass.SIGNAL_STRENGTH
@@ -348,8 +949,9 @@ class FireboardRSSISensor(SensorEntity):
     def device_info(self) -> DeviceInfo:
         return self._hub.device_info
 
-    def update_rssi(self, rssi):
+    def update_rssi(self, rssi, sources):
         self._attr_native_value = rssi
+        self._attr_extra_state_attributes = {"sources": sources}
         self.schedule_update_ha_state()
 
 class FireboardStatusSensor(SensorEntity):
@@ -393,4 +995,39 @@ class FireboardSourceSensor(SensorEntity):
     def update_source(self, source):
         if self._attr_native_value != source:
             self._attr_native_value = source
-            self.schedule_update_ha_state()
\ No newline at end of file
+            self.schedule_update_ha_state()
+
+# Diagnostic performance sensors (disabled by default)
+# key: (name, unit, icon, value from hub)
+METRIC_SENSORS = {
+    "frames_per_second": ("Frames Per Second", "fps", "mdi:speedometer", lambda hub: round(hub.metrics.frames_per_second, 2)),
+    "parse_errors": ("Parse Errors", None, "mdi:alert-circle-outline", lambda hub: hub.parser.malformed + hub.parser.resynced),
+    "reconnects": ("Reconnects", None, "mdi:connection", lambda hub: sum(hub.metrics.reconnects_by_source.values())),
+    "connect_time": ("Last Connect Time", UnitOfTime.SECONDS, "mdi:timer-outline", lambda hub: hub.metrics.time_to_connect.last),
+    "reconnect_time": ("Last Reconnect Time", UnitOfTime.SECONDS, "mdi:timer-refresh-outline", lambda hub: hub.metrics.time_to_reconnect.last),
+}
+
+class FireboardMetricSensor(SensorEntity):
+    """Polled diagnostic view of the hub's performance counters."""
+    _attr_has_entity_name = True
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_enabled_default = False
+
+    def __init__(self, hub, key):
+        self._hub = hub
+        self._key = key
+        name, unit, icon, self._value_fn = METRIC_SENSORS[key]
+        self._attr_unique_id = f"fireboard_{hub.mac}_{key}"
+        self._attr_name = name
+        self._attr_native_unit_of_measurement = unit
+        self._attr_icon = icon
+        self._attr_state_class = SensorStateClass.MEASUREMENT if unit else SensorStateClass.TOTAL_INCREASING
+        if unit == UnitOfTime.SECONDS:
+            self._attr_device_class = SensorDeviceClass.DURATION
+
+    @property
+    def device_info(self) -> DeviceInfo:
+        return self._hub.device_info
+
+    async def async_update(self) -> None:
+        self._attr_native_value = self._value_fn(self._hub)
@@ -0,0 +1,47 @@
+"""Services for FireBoard BLE."""
+from __future__ import annotations
+
+import voluptuous as vol
+
+from homeassistant.core import HomeAssistant, ServiceCall, callback
+from homeassistant.exceptions import HomeAssistantError
+
+from .const import DOMAIN, RUNTIME_KEY
+from .websocket import find_hub
+
+SERVICE_START_SESSION = "start_session"
+SERVICE_STOP_SESSION = "stop_session"
+
+SESSION_SCHEMA = vol.Schema(
+    {
+        vol.Exclusive("entry_id", "device"): str,
+        vol.Exclusive("address", "device"): str,
+    }
+)
+
+
+def _hubs(hass: HomeAssistant, call: ServiceCall) -> list:
+    """The hub named in the call, or every running hub if none is named."""
+    if "entry_id" in call.data or "address" in call.data:
+        hub = find_hub(hass, call.data.get("entry_id"), call.data.get("address"))
+        if hub is None:
+            raise HomeAssistantError("FireBoard not found")
+        return [hub]
+    runtime = hass.data.get(DOMAIN, {}).get(RUNTIME_KEY)
+    return list(runtime.hubs.values()) if runtime else []
+
+
+@callback
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the session services."""
+
+    async def start_session(call: ServiceCall) -> None:
+        for hub in _hubs(hass, call):
+            hub.start_session(manual=True)
+
+    async def stop_session(call: ServiceCall) -> None:
+        for hub in _hubs(hass, call):
+            await hub.async_stop_session(manual=True)
+
+    hass.services.async_register(DOMAIN, SERVICE_START_SESSION, start_session, schema=SESSION_SCHEMA)
+    hass.services.async_register(DOMAIN, SERVICE_STOP_SESSION, stop_session, schema=SESSION_SCHEMA)
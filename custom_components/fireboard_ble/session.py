@@ -0,0 +1,47 @@
+"""A live GATT session that can outlive the hub that opened it."""
+from __future__ import annotations
+
+from typing import NamedTuple
+
+
+class BleSession:
+    """Routes a BleakClient's callbacks to whichever hub currently owns it.
+
+    Bleak binds the notification and disconnect callbacks when the link is
+    set up. Going through this object lets an options reload hand the link
+    to the new hub instead of reconnecting. While `hub` is None (between
+    two owners) callbacks are dropped.
+    """
+
+    __slots__ = ("hub", "lease", "client", "source")
+
+    def __init__(self, hub, lease) -> None:
+        self.hub = hub
+        self.lease = lease
+        self.client = None
+        # The proxy holding the link, when known (HA picks it, not the lease)
+        self.source = None
+
+    def notification(self, sender, data) -> None:
+        hub = self.hub
+        if hub is not None:
+            hub._handle_notification(sender, data)
+
+    def disconnected(self, client) -> None:
+        hub = self.hub
+        if hub is not None and client is self.client:
+            hub._on_disconnect(client)
+
+
+class HubHandoff(NamedTuple):
+    """What an options reload carries from the old hub to the new one."""
+
+    session: BleSession
+    parser: object
+    metrics: object
+    gatt_handles: tuple | None
+    last_source: str | None
+    probes: dict
+    trends: dict
+    archive: object
+    archive_held: bool
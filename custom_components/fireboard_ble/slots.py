@@ -0,0 +1,163 @@
+"""Connection-slot coordination across every FireBoard on the host."""
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections import deque
+
+from homeassistant.core import HomeAssistant, callback
+
+from .const import DOMAIN, SLOTS_KEY
+
+_LOGGER = logging.getLogger(__name__)
+
+# A proxy that answered "connection slot" is skipped for this long
+FULL_COOLDOWN = 60
+# Waiters are re-checked this often, since proxies don't tell us when a
+# slot frees up for another integration.
+RECHECK_INTERVAL = 5
+# The hub's last working proxy is preferred unless another is this much stronger
+AFFINITY_MARGIN_DB = 10
+
+
+def get_slot_manager(hass: HomeAssistant) -> ConnectionSlotManager:
+    """Return the domain-wide slot manager, creating it on first use."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if SLOTS_KEY not in domain_data:
+        domain_data[SLOTS_KEY] = ConnectionSlotManager(hass)
+    return domain_data[SLOTS_KEY]
+
+
+class SlotLease:
+    """A reservation of one connection slot on one Bluetooth source."""
+
+    __slots__ = ("_manager", "mac", "source", "ble_device", "released")
+
+    def __init__(self, manager, mac, source, ble_device):
+        self._manager = manager
+        self.mac = mac
+        self.source = source
+        self.ble_device = ble_device
+        self.released = False
+
+    def release(self):
+        if not self.released:
+            self.released = True
+            self._manager._release(self)
+
+
+class ConnectionSlotManager:
+    """Hands out proxy slots to FireBoard hubs in FIFO order.
+
+    Every hub asks for a lease before connecting. A waiter is given the
+    strongest source (by last RSSI seen in `_handle_bluetooth_event`) that
+    reports a free slot, isn't cooling down after a "connection slot"
+    error and doesn't already have another FireBoard mid-connect. A hub can
+    name a `prefer`red source (the last one that worked); it wins unless it
+    is more than AFFINITY_MARGIN_DB weaker than the best candidate.
+
+    The granted source paces connection attempts, but HA's Bleak wrapper
+    picks the backend it really connects through by itself.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        self.hass = hass
+        self._rssi: dict[str, dict[str, int]] = {}
+        # source -> the lease connecting through it
+        self._connecting: dict[str, SlotLease] = {}
+        self._full_until: dict[str, float] = {}
+        self._waiters: deque = deque()
+        self._recheck: asyncio.TimerHandle | None = None
+
+    @callback
+    def note_advertisement(self, mac, source, rssi) -> None:
+        self._rssi.setdefault(mac, {})[source] = rssi
+        if self._waiters:
+            self._dispatch()
+
+    @callback
+    def mark_full(self, source) -> None:
+        _LOGGER.info(f"[FireBoard] Proxy {source} has no free slot, skipping it for {FULL_COOLDOWN}s.")
+        self._full_until[source] = self.hass.loop.time() + FULL_COOLDOWN
+
+    @callback
+    def mark_connected(self, lease: SlotLease) -> None:
+        self._end_connecting(lease)
+        self._dispatch()
+
+    def sources_for(self, mac) -> dict[str, int]:
+        """Last (smoothed) RSSI per source for a device."""
+        return {source: round(rssi) for source, rssi in self._rssi.get(mac, {}).items() if rssi is not None}
+
+    async def acquire(self, mac, transport, timeout=None, prefer=None) -> SlotLease | None:
+        """Wait for a free slot. Returns None on timeout."""
+        future = self.hass.loop.create_future()
+        self._waiters.append((mac, transport, prefer, future))
+        self._dispatch()
+        try:
+            return await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError:
+            return None
+        except asyncio.CancelledError:
+            # Granted just as we were cancelled: hand the slot back
+            if future.done() and not future.cancelled():
+                future.result().release()
+            raise
+
+    def _release(self, lease: SlotLease) -> None:
+        self._end_connecting(lease)
+        self._dispatch()
+
+    def _end_connecting(self, lease: SlotLease) -> None:
+        # Another hub may be connecting through the source by now
+        if self._connecting.get(lease.source) is lease:
+            del self._connecting[lease.source]
+
+    def _candidates(self, mac, transport):
+        now = self.hass.loop.time()
+        rssi_seen = self._rssi.get(mac, {})
+        candidates = []
+
+        for device in transport.scanner_devices(mac):
+            scanner = device.scanner
+            source = scanner.source
+            if self._full_until.get(source, 0) > now:
+                continue
+            if source in self._connecting:
+                continue
+            connector = getattr(scanner, "connector", None)
+            if connector is not None and not connector.can_connect():
+                continue
+            rssi = rssi_seen.get(source, device.advertisement.rssi)
+            candidates.append((rssi if rssi is not None else -127, source, device.ble_device))
+
+        candidates.sort(key=lambda item: item[0], reverse=True)
+        return candidates
+
+    @callback
+    def _dispatch(self) -> None:
+        waiting = deque()
+
+        while self._waiters:
+            mac, transport, prefer, future = self._waiters.popleft()
+            if future.done():
+                continue
+            candidates = self._candidates(mac, transport)
+            if not candidates:
+                waiting.append((mac, transport, prefer, future))
+                continue
+            best_rssi, source, ble_device = candidates[0]
+            for rssi, candidate, device in candidates:
+                if candidate == prefer and rssi >= best_rssi - AFFINITY_MARGIN_DB:
+                    source, ble_device = candidate, device
+                    break
+            lease = self._connecting[source] = SlotLease(self, mac, source, ble_device)
+            future.set_result(lease)
+
+        self._waiters = waiting
+
+        if self._recheck:
+            self._recheck.cancel()
+            self._recheck = None
+        if self._waiters:
+            self._recheck = self.hass.loop.call_later(RECHECK_INTERVAL, self._dispatch)
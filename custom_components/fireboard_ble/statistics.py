@@ -0,0 +1,118 @@
+"""Per-minute probe aggregates, imported hourly as long-term statistics."""
+from __future__ import annotations
+
+import logging
+
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+MINUTE = 60
+HOUR = 3600
+
+
+class ProbeStatistics:
+    """Min/max/mean of one probe per minute, rolled up into hourly rows.
+
+    Long-term statistics in HA are hourly, so the minute buckets only live
+    until their hour is imported. The hourly mean is the mean of the
+    minute means, which keeps bursts of readings from skewing it.
+    """
+
+    __slots__ = ("minutes", "_minute", "_count", "_sum", "_min", "_max")
+
+    def __init__(self) -> None:
+        # (minute start, min, max, mean) for minutes not yet imported
+        self.minutes: list[tuple[int, float, float, float]] = []
+        self._minute = None
+        self._count = 0
+        self._sum = 0.0
+        self._min = 0.0
+        self._max = 0.0
+
+    def add(self, timestamp: float, temp: float) -> None:
+        minute = int(timestamp // MINUTE) * MINUTE
+        if minute != self._minute:
+            self._close_minute()
+            self._minute = minute
+            self._min = self._max = temp
+        elif temp < self._min:
+            self._min = temp
+        elif temp > self._max:
+            self._max = temp
+        self._count += 1
+        self._sum += temp
+
+    def _close_minute(self) -> None:
+        if self._count:
+            self.minutes.append((self._minute, self._min, self._max, self._sum / self._count))
+            self._count = 0
+            self._sum = 0.0
+
+    def convert(self, convert) -> None:
+        """Convert what is held so far, e.g. after the probe changed unit."""
+        self.minutes = [
+            (minute, convert(low), convert(high), convert(mean))
+            for minute, low, high, mean in self.minutes
+        ]
+        if self._count:
+            self._min = convert(self._min)
+            self._max = convert(self._max)
+            self._sum = convert(self._sum / self._count) * self._count
+
+    def pop_hours(self, before: float) -> list[dict]:
+        """Hourly rows for every hour starting before `before`; those minutes are dropped."""
+        if self._minute is not None and self._minute < before:
+            self._close_minute()
+            self._minute = None
+        rows = []
+        keep = []
+        for bucket in self.minutes:
+            if bucket[0] >= before:
+                keep.append(bucket)
+                continue
+            hour = bucket[0] // HOUR * HOUR
+            if not rows or rows[-1][0] != hour:
+                rows.append([hour, []])
+            rows[-1][1].append(bucket)
+        self.minutes = keep
+        return [
+            {
+                "start": dt_util.utc_from_timestamp(hour),
+                "min": round(min(b[1] for b in buckets), 2),
+                "max": round(max(b[2] for b in buckets), 2),
+                "mean": round(sum(b[3] for b in buckets) / len(buckets), 2),
+            }
+            for hour, buckets in rows
+        ]
+
+
+def statistic_id(mac: str, channel: int) -> str:
+    return f"{DOMAIN}:{mac.replace(':', '').lower()}_ch{channel}"
+
+
+def import_probe_statistics(hass: HomeAssistant, hub, before: float) -> None:
+    """Import the finished hours of every probe of `hub` into the recorder."""
+    if "recorder" not in hass.config.components:
+        return
+    from homeassistant.components.recorder.statistics import async_add_external_statistics
+
+    for channel, sensor in hub.sensors.items():
+        rows = sensor.stats.pop_hours(before)
+        if not rows:
+            continue
+        metadata = {
+            "has_mean": True,
+            "has_sum": False,
+            "name": f"{hub.device_name} Probe {channel}",
+            "source": DOMAIN,
+            "statistic_id": statistic_id(hub.mac, channel),
+            "unit_of_measurement": sensor.native_unit_of_measurement,
+        }
+        try:
+            async_add_external_statistics(hass, metadata, rows)
+        except Exception as e:
+            _LOGGER.warning(f"[FireBoard] Could not import statistics for probe {channel}: {e}")
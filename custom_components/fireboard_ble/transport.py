@@ -0,0 +1,59 @@
+"""The Bluetooth calls a FireBoard hub makes."""
+from __future__ import annotations
+
+from homeassistant.components.bluetooth import (
+    async_ble_device_from_address,
+    async_register_callback,
+    async_scanner_devices_by_address,
+    BluetoothCallbackMatcher,
+)
+from homeassistant.core import HomeAssistant
+
+
+class BleTransport:
+    """Thin wrapper over HA's bluetooth API and bleak-retry-connector.
+
+    The hub and the slot manager only talk to Bluetooth through this
+    object, so the replay harness can substitute a recorded session.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        self.hass = hass
+
+    def ble_device_from_address(self, mac):
+        return async_ble_device_from_address(self.hass, mac, connectable=True)
+
+    def scanner_devices(self, mac):
+        return async_scanner_devices_by_address(self.hass, mac, connectable=True)
+
+    def register_callback(self, callback, mac, mode):
+        """Advertisements of `mac`."""
+        return async_register_callback(
+            self.hass, callback, BluetoothCallbackMatcher(address=mac), mode
+        )
+
+    def connected_source(self, client):
+        """The source HA actually connected `client` through, if it can be told.
+
+        HA's Bleak wrapper chooses the backend from the address alone, so
+        a lease's source is only our guess. Remote backends keep the
+        BLEDevice they were built for, whose details name the proxy.
+        """
+        backend = getattr(client, "_backend", None)
+        details = getattr(getattr(backend, "_ble_device", None), "details", None)
+        if isinstance(details, dict):
+            return details.get("source")
+        return None
+
+    async def connect(self, ble_device, mac, disconnected_callback):
+        # Imported on first connect: bleak and its backends are heavy and
+        # not needed at all during replay.
+        from bleak_retry_connector import BleakClientWithServiceCache, establish_connection
+
+        return await establish_connection(
+            BleakClientWithServiceCache,
+            ble_device,
+            mac,
+            disconnected_callback=disconnected_callback,
+            use_services_cache=True,
+        )
@@ -0,0 +1,161 @@
+"""Websocket API for FireBoard BLE."""
+from __future__ import annotations
+
+import csv
+import io
+from typing import Any
+
+import voluptuous as vol
+
+from homeassistant.components import websocket_api
+from homeassistant.core import HomeAssistant, callback
+
+from .archive import SessionReader, list_sessions, session_dir, session_path
+from .const import DOMAIN, RUNTIME_KEY
+from .history import downsample
+from .sensor import FireboardHub
+
+
+@callback
+def async_setup_websocket(hass: HomeAssistant) -> None:
+    """Register the websocket commands."""
+    websocket_api.async_register_command(hass, ws_history)
+    websocket_api.async_register_command(hass, ws_sessions)
+    websocket_api.async_register_command(hass, ws_session)
+
+
+def find_hub(hass: HomeAssistant, entry_id: str | None = None, address: str | None = None):
+    """Return the running hub for a config entry or device address."""
+    domain_data = hass.data.get(DOMAIN, {})
+    if entry_id:
+        # hass.data[DOMAIN] also holds the shared runtime, slots and handoffs
+        hub = domain_data.get(entry_id)
+        return hub if isinstance(hub, FireboardHub) else None
+    runtime = domain_data.get(RUNTIME_KEY)
+    if address and runtime:
+        return runtime.hubs.get(address.upper())
+    return None
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "fireboard_ble/history",
+        vol.Exclusive("entry_id", "device"): str,
+        vol.Exclusive("address", "device"): str,
+        vol.Optional("channel"): vol.Coerce(int),
+        vol.Optional("start_time"): vol.Coerce(float),
+        vol.Optional("end_time"): vol.Coerce(float),
+        vol.Optional("max_points", default=500): vol.All(
+            vol.Coerce(int), vol.Range(min=2, max=10000)
+        ),
+    }
+)
+@callback
+def ws_history(
+    hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Return a downsampled window of in-memory probe history."""
+    hub = find_hub(hass, msg.get("entry_id"), msg.get("address"))
+    if hub is None:
+        connection.send_error(msg["id"], websocket_api.ERR_NOT_FOUND, "FireBoard not found")
+        return
+
+    channels = [msg["channel"]] if "channel" in msg else sorted(hub.sensors)
+    result = {}
+    for channel in channels:
+        sensor = hub.sensors.get(channel)
+        if sensor is None:
+            continue
+        result[channel] = {
+            "entity_id": sensor.entity_id,
+            "unit": sensor.native_unit_of_measurement,
+            "points": sensor.history.downsample(
+                msg.get("start_time"), msg.get("end_time"), msg["max_points"]
+            ),
+        }
+
+    connection.send_result(msg["id"], {"address": hub.mac, "channels": result})
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "fireboard_ble/sessions",
+        vol.Exclusive("entry_id", "device"): str,
+        vol.Exclusive("address", "device"): str,
+    }
+)
+@websocket_api.async_response
+async def ws_sessions(
+    hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """List the archived cook sessions of a FireBoard."""
+    hub = find_hub(hass, msg.get("entry_id"), msg.get("address"))
+    if hub is None:
+        connection.send_error(msg["id"], websocket_api.ERR_NOT_FOUND, "FireBoard not found")
+        return
+    if hub.archive:
+        await hub.archive.async_flush()
+    sessions = await hass.async_add_executor_job(list_sessions, session_dir(hass, hub.mac))
+    active = hub.archive.session_id if hub.archive else None
+    for session in sessions:
+        session["active"] = session["session_id"] == active
+    connection.send_result(msg["id"], {"address": hub.mac, "sessions": sessions})
+
+
+def _read_session(path, channel, start, end, max_points, fmt):
+    with SessionReader(path) as reader:
+        if fmt == "csv":
+            out = io.StringIO()
+            writer = csv.writer(out)
+            writer.writerow(["timestamp", "channel", "temperature"])
+            for ts, ch, temp in reader.rows(start, end, channel):
+                writer.writerow([f"{ts:.3f}", ch, f"{temp:.2f}"])
+            return {"csv": out.getvalue()}
+        return {
+            "channels": {
+                ch: downsample(ts, temps, max_points)
+                for ch, (ts, temps) in sorted(reader.read(start, end, channel).items())
+            }
+        }
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "fireboard_ble/session",
+        vol.Exclusive("entry_id", "device"): str,
+        vol.Exclusive("address", "device"): str,
+        vol.Required("session_id"): str,
+        vol.Optional("channel"): vol.Coerce(int),
+        vol.Optional("start_time"): vol.Coerce(float),
+        vol.Optional("end_time"): vol.Coerce(float),
+        vol.Optional("max_points", default=500): vol.All(
+            vol.Coerce(int), vol.Range(min=2, max=10000)
+        ),
+        vol.Optional("format", default="json"): vol.In(("json", "csv")),
+    }
+)
+@websocket_api.async_response
+async def ws_session(
+    hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Return a downsampled range of an archived session, or the range as CSV."""
+    hub = find_hub(hass, msg.get("entry_id"), msg.get("address"))
+    if hub is None:
+        connection.send_error(msg["id"], websocket_api.ERR_NOT_FOUND, "FireBoard not found")
+        return
+    try:
+        path = session_path(hass, hub.mac, msg["session_id"])
+    except ValueError as e:
+        connection.send_error(msg["id"], websocket_api.ERR_INVALID_FORMAT, str(e))
+        return
+    if hub.archive and hub.archive.session_id == msg["session_id"]:
+        await hub.archive.async_flush()
+    try:
+        result = await hass.async_add_executor_job(
+            _read_session, path, msg.get("channel"), msg.get("start_time"),
+            msg.get("end_time"), msg["max_points"], msg["format"],
+        )
+    except (OSError, ValueError):
+        connection.send_error(msg["id"], websocket_api.ERR_NOT_FOUND, "Session not found")
+        return
+    connection.send_result(msg["id"], {"address": hub.mac, "session_id": msg["session_id"], **result})
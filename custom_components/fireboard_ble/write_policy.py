@@ -0,0 +1,58 @@
+"""Decides when a probe reading is worth a state write."""
+from __future__ import annotations
+
+from .const import (
+    CONF_DEADBAND,
+    CONF_MAX_WRITE_INTERVAL,
+    CONF_MIN_WRITE_INTERVAL,
+    DEFAULT_DEADBAND,
+    DEFAULT_MAX_WRITE_INTERVAL,
+    DEFAULT_MIN_WRITE_INTERVAL,
+)
+
+WRITE_NOW = 0.0
+
+
+class WritePolicy:
+    """Deadband, rate limit and heartbeat for one device's probes.
+
+    `evaluate` returns WRITE_NOW, a delay in seconds after which the write
+    should be retried, or None when the reading can be dropped.
+    """
+
+    __slots__ = ("deadband", "min_interval", "max_interval")
+
+    def __init__(self, deadband, min_interval, max_interval):
+        self.deadband = deadband
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+
+    @classmethod
+    def from_options(cls, options) -> WritePolicy:
+        return cls(
+            options.get(CONF_DEADBAND, DEFAULT_DEADBAND),
+            options.get(CONF_MIN_WRITE_INTERVAL, DEFAULT_MIN_WRITE_INTERVAL),
+            options.get(CONF_MAX_WRITE_INTERVAL, DEFAULT_MAX_WRITE_INTERVAL),
+        )
+
+    def evaluate(self, written_value, written_at, value, now, forced=False):
+        if written_at is None:
+            return WRITE_NOW
+
+        elapsed = now - written_at
+        if elapsed < self.min_interval:
+            # Too soon: come back once the interval is up so the latest
+            # value still lands (trailing write).
+            if forced or written_value is None or value is None:
+                return self.min_interval - elapsed
+            if abs(value - written_value) >= self.deadband:
+                return self.min_interval - elapsed
+            return None
+
+        if forced or written_value is None or value is None:
+            return WRITE_NOW
+        if abs(value - written_value) >= self.deadband:
+            return WRITE_NOW
+        if elapsed >= self.max_interval:
+            return WRITE_NOW
+        return None
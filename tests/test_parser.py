@@ -0,0 +1,97 @@
+"""Tests for the streaming notification parser."""
+from custom_components.fireboard_ble.parser import MAX_FRAME_BYTES, NotificationParser
+
+FRAME = b'{"channel":1,"temp":150.5,"date":"2024-05-01 12:00:00","degreetype":2}'
+FRAME_2 = b'{"channel":2,"temp":98,"date":"2024-05-01 12:00:01","degreetype":2}'
+
+
+def test_whole_frame():
+    parser = NotificationParser()
+    (reading,) = parser.feed(FRAME)
+    assert reading.channel == 1
+    assert reading.temp == 150.5
+    assert reading.date == "2024-05-01 12:00:00"
+    assert reading.degreetype == 2
+    assert parser.stats == {"frames": 1, "malformed": 0, "resynced": 0, "buffered_bytes": 0}
+
+
+def test_trailing_whitespace_is_not_a_resync():
+    parser = NotificationParser()
+    for ending in (b"\n", b"\r\n", b" \t\n"):
+        assert [r.channel for r in parser.feed(FRAME + ending)] == [1]
+    assert parser.stats == {"frames": 3, "malformed": 0, "resynced": 0, "buffered_bytes": 0}
+
+
+def test_whitespace_between_fragments_is_not_a_resync():
+    parser = NotificationParser()
+    assert parser.feed(FRAME[:30]) == []
+    assert [r.channel for r in parser.feed(FRAME[30:] + b"\r\n")] == [1]
+    assert [r.channel for r in parser.feed(b"\n" + FRAME_2)] == [2]
+    assert parser.feed(b"\r\n") == []
+    assert parser.frames == 2 and parser.resynced == 0 and parser.malformed == 0
+
+
+def test_fragments_are_reassembled():
+    parser = NotificationParser()
+    readings = []
+    for start in range(0, len(FRAME), 20):
+        readings += parser.feed(FRAME[start:start + 20])
+    assert [r.temp for r in readings] == [150.5]
+    assert parser.stats["buffered_bytes"] == 0 and parser.resynced == 0
+
+
+def test_two_frames_in_one_notification():
+    parser = NotificationParser()
+    assert [r.channel for r in parser.feed(FRAME + FRAME_2)] == [1, 2]
+    assert parser.resynced == 0
+
+
+def test_frame_split_across_the_next_one():
+    parser = NotificationParser()
+    assert [r.channel for r in parser.feed(FRAME + FRAME_2[:25])] == [1]
+    assert [r.channel for r in parser.feed(FRAME_2[25:])] == [2]
+    assert parser.resynced == 0
+
+
+def test_lost_head_is_skipped():
+    parser = NotificationParser()
+    # The first fragment of a frame never arrived: only its tail does.
+    assert parser.feed(FRAME[30:]) == []
+    assert [r.channel for r in parser.feed(FRAME_2)] == [2]
+    assert parser.resynced == 1 and parser.malformed == 0
+
+
+def test_lost_tail_is_dropped():
+    parser = NotificationParser()
+    # A frame's tail was lost; the next frame must not be poisoned by it.
+    assert parser.feed(FRAME[:30]) == []
+    assert [r.channel for r in parser.feed(FRAME_2)] == [2]
+    assert parser.resynced == 1 and parser.stats["buffered_bytes"] == 0
+
+
+def test_unclosed_garbage_is_bounded():
+    parser = NotificationParser()
+    assert parser.feed(b"{" + b"x" * MAX_FRAME_BYTES) == []
+    assert parser.malformed == 1 and parser.stats["buffered_bytes"] == 0
+    assert [r.channel for r in parser.feed(FRAME)] == [1]
+
+
+def test_malformed_frame_is_counted():
+    parser = NotificationParser()
+    assert parser.feed(b'{"channel":1,"temp":oops}') == []
+    assert parser.malformed == 1 and parser.frames == 0
+
+
+def test_escaped_strings_use_the_full_decoder():
+    parser = NotificationParser()
+    (reading,) = parser.feed(b'{"channel":3,"temp":100,"date":"a\\"b"}')
+    assert reading.date == 'a"b'
+    assert reading.degreetype == 2
+
+
+def test_reset_drops_partial_frame():
+    parser = NotificationParser()
+    parser.feed(FRAME[:30])
+    parser.reset()
+    assert [r.channel for r in parser.feed(FRAME_2)] == [2]
+    assert parser.resynced == 0